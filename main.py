@@ -190,22 +190,17 @@ def handle_move_operation(args, vals):
     path_mappings = parse_path_mappings_string(args.immich_path_mapping)
 
     # Initialize clients
-    immich_client = ImmichClient(
-        args.immich_url,
-        args.immich_key,
-        path_mappings
-    )
-
-    asset_mover = AssetMover(
-        immich_client,
-        args.move_destination,
-        path_mappings,
-        dry_run=args.dry_run
-    )
+    with ImmichClient(args.immich_url, args.immich_key, path_mappings) as immich_client:
+        asset_mover = AssetMover(
+            immich_client,
+            args.move_destination,
+            path_mappings,
+            dry_run=args.dry_run
+        )
 
-    # Process assets
-    print("\nProcessing tagged assets...")
-    results = asset_mover.process_tagged_assets(args.immich_tag)
+        # Process assets
+        print("\nProcessing tagged assets...")
+        results = asset_mover.process_tagged_assets(args.immich_tag)
 
     # Update database with move results
     if not args.dry_run and not args.no_cache:
@@ -262,20 +257,16 @@ def handle_dedup_operation(args, vals):
     validate_dedup_arguments(args)
 
     # Initialize Immich client
-    immich_client = ImmichClient(
-        args.immich_url,
-        args.immich_key
-    )
-
-    # Initialize DedupProcessor
-    dedup_processor = DedupProcessor(
-        immich_client,
-        args.immich_internal_path,
-        args.immich_picture_library_path
-    )
+    with ImmichClient(args.immich_url, args.immich_key) as immich_client:
+        # Initialize DedupProcessor
+        dedup_processor = DedupProcessor(
+            immich_client,
+            args.immich_internal_path,
+            args.immich_picture_library_path
+        )
 
-    print("\nStarting deduplication...")
-    dedup_processor.execute(dry_run=args.dry_run)
+        print("\nStarting deduplication...")
+        dedup_processor.execute(dry_run=args.dry_run)
 
     # Exit after dedup operation if called directly
     if not args.process_new:
@@ -339,21 +330,16 @@ def handle_process_new_operation(args, vals):
     confirm_move_operation(args, vals)
     
     # Initialize clients for moving
-    immich_client = ImmichClient(
-        args.immich_url,
-        args.immich_key,
-        path_mappings
-    )
-    
-    asset_mover = AssetMover(
-        immich_client,
-        args.move_destination,
-        path_mappings,
-        dry_run=args.dry_run
-    )
-    
-    # Process tagged assets
-    results = asset_mover.process_tagged_assets(args.immich_tag)
+    with ImmichClient(args.immich_url, args.immich_key, path_mappings) as immich_client:
+        asset_mover = AssetMover(
+            immich_client,
+            args.move_destination,
+            path_mappings,
+            dry_run=args.dry_run
+        )
+
+        # Process tagged assets
+        results = asset_mover.process_tagged_assets(args.immich_tag)
     
     # Step 4: Update database with move results
     if not args.dry_run and not args.no_cache:
@@ -436,21 +422,16 @@ def handle_reprocess_full_operation(args, vals):
     confirm_move_operation(args, vals)
     
     # Initialize clients for moving
-    immich_client = ImmichClient(
-        args.immich_url,
-        args.immich_key,
-        path_mappings
-    )
-    
-    asset_mover = AssetMover(
-        immich_client,
-        args.move_destination,
-        path_mappings,
-        dry_run=args.dry_run
-    )
-    
-    # Process tagged assets
-    results = asset_mover.process_tagged_assets(args.immich_tag)
+    with ImmichClient(args.immich_url, args.immich_key, path_mappings) as immich_client:
+        asset_mover = AssetMover(
+            immich_client,
+            args.move_destination,
+            path_mappings,
+            dry_run=args.dry_run
+        )
+
+        # Process tagged assets
+        results = asset_mover.process_tagged_assets(args.immich_tag)
     
     # Step 3: Update database with move results
     if not args.dry_run and not args.no_cache:
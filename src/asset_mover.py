@@ -4,12 +4,19 @@ import csv
 import json
 import hashlib
 from datetime import datetime
+from operator import itemgetter
 from typing import Dict, Optional, List
 from tqdm import tqdm
 from src.immich_client import ImmichClient
 
 
 class AssetMover:
+    CSV_FIELDS = (
+        'asset_id', 'immich_path', 'source_path', 'dest_path',
+        'move_success', 'delete_success', 'error'
+    )
+    QUICK_COMPARE_BYTES = 64 * 1024
+
     def __init__(self, immich_client: ImmichClient, destination_root: str,
                  path_mappings: Dict[str, str], dry_run: bool = False):
         self.immich_client = immich_client
@@ -30,12 +37,8 @@ class AssetMover:
             Hex digest of the file hash, or None if error
         """
         try:
-            hash_obj = hashlib.new(algorithm)
             with open(file_path, 'rb') as f:
-                # Read file in chunks to handle large files
-                for chunk in iter(lambda: f.read(8192), b''):
-                    hash_obj.update(chunk)
-            return hash_obj.hexdigest()
+                return hashlib.file_digest(f, algorithm).hexdigest()
         except Exception:
             return None
 
@@ -119,10 +122,7 @@ class AssetMover:
 
     def _handle_existing_dest_file(self, source_path: str, dest_path: str) -> tuple[bool, Optional[str], str]:
         """Handle case where destination file already exists."""
-        source_hash = self.calculate_file_hash(source_path)
-        dest_hash = self.calculate_file_hash(dest_path)
-
-        if source_hash and dest_hash and source_hash == dest_hash:
+        if self._is_same_content(source_path, dest_path):
             # Files are identical, just remove source
             try:
                 os.remove(source_path)
@@ -133,6 +133,26 @@ class AssetMover:
         # Different files at destination - get unique name
         return True, None, self._get_unique_dest_path(dest_path)
 
+    def _is_same_content(self, source_path: str, dest_path: str) -> bool:
+        """
+        Check whether two files are identical.
+
+        Sizes are compared first, then the leading QUICK_COMPARE_BYTES; the full
+        hashes are only computed when both of those match.
+        """
+        try:
+            if os.path.getsize(source_path) != os.path.getsize(dest_path):
+                return False
+            with open(source_path, 'rb') as src, open(dest_path, 'rb') as dst:
+                if src.read(self.QUICK_COMPARE_BYTES) != dst.read(self.QUICK_COMPARE_BYTES):
+                    return False
+        except OSError:
+            return False
+
+        source_hash = self.calculate_file_hash(source_path)
+        dest_hash = self.calculate_file_hash(dest_path)
+        return bool(source_hash and dest_hash and source_hash == dest_hash)
+
     def save_transaction_log(self, filename: str):
         """
         Save transaction log to JSON file.
@@ -148,13 +168,11 @@ class AssetMover:
         """
         Save CSV report of processed assets.
         """
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=[
-                'asset_id', 'immich_path', 'source_path', 'dest_path',
-                'move_success', 'delete_success', 'error'
-            ])
-            writer.writeheader()
-            writer.writerows(self.transaction_log)
+        row_values = itemgetter(*self.CSV_FIELDS)
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(self.CSV_FIELDS)
+            writer.writerows(map(row_values, self.transaction_log))
 
     def process_tagged_assets(self, tag_name: str) -> Dict[str, int]:
         """
@@ -1,5 +1,6 @@
 import os
 import csv
+from bisect import bisect_right
 from typing import List, Dict, Optional
 from tqdm import tqdm
 from .classifier import WatercolorClassifier
@@ -8,6 +9,14 @@ from .immich_client import ImmichClient
 
 
 class BatchProcessor:
+    # Lower bounds of the granular confidence buckets and the tag for each;
+    # GRANULAR_TAGS[0] covers everything below the lowest bound
+    GRANULAR_THRESHOLDS = (0.35, 0.45, 0.55, 0.65, 0.75, 0.85)
+    GRANULAR_TAGS = (None, "Watercolor35", "Watercolor45", "Watercolor55",
+                     "Watercolor65", "Watercolor75", "Watercolor85")
+    # Top labels that also earn the "Painting" tag
+    PAINTING_LABELS = frozenset({"a watercolor painting", "an oil painting", "an acrylic painting"})
+
     def __init__(self, classifier: WatercolorClassifier, video_processor: VideoProcessor):
         self.classifier = classifier
         self.video_processor = video_processor
@@ -25,19 +34,8 @@ class BatchProcessor:
         Returns:
             Tag name or None if below threshold
         """
-        if confidence >= 0.85:
-            return "Watercolor85"
-        elif confidence >= 0.75:
-            return "Watercolor75"
-        elif confidence >= 0.65:
-            return "Watercolor65"
-        elif confidence >= 0.55:
-            return "Watercolor55"
-        elif confidence >= 0.45:
-            return "Watercolor45"
-        elif confidence >= 0.35:
-            return "Watercolor35"
-        return None
+        # bisect compares against the exact bounds, so there's no float rounding at the edges
+        return BatchProcessor.GRANULAR_TAGS[bisect_right(BatchProcessor.GRANULAR_THRESHOLDS, confidence)]
 
     def process_folder(self, folder_path: str, min_frames: int = 3,
                        detection_threshold: float = 0.3, strict_mode: bool = False,
@@ -48,8 +46,6 @@ class BatchProcessor:
         """
         Recursively process a folder and write results to a CSV file.
         """
-        immich_client, tag_id = self._initialize_immich(immich_url, immich_api_key, immich_tag, immich_path_mappings)
-
         files_to_process = self._collect_files(folder_path)
         print(f"Found {len(files_to_process)} files to process in {folder_path}")
 
@@ -57,36 +53,53 @@ class BatchProcessor:
             print("No supported files found.")
             return
 
+        immich_client, tag_id = self._initialize_immich(immich_url, immich_api_key, immich_tag, immich_path_mappings)
+
         results = []
+        failed = []  # (file_path, error_result) pairs, written to the cache in one transaction
+        tagged_assets = []
 
-        # Use tqdm for a progress bar
         try:
-            for file_path in tqdm(files_to_process, desc="Processing files"):
-                try:
-                    result_data = self._process_file_in_batch(
-                        file_path, min_frames, detection_threshold, strict_mode,
-                        image_threshold, force_reprocess, quick_sync
-                    )
-                    if result_data:
-                        results.append(result_data)
-                except Exception as e:
-                    print(f"Error processing {file_path}: {e}")
-                    error_result = self._create_error_result(file_path, str(e))
-                    results.append(error_result)
-                    if self.classifier.db:
-                        self.classifier.db.save_result(file_path, error_result)
-        except KeyboardInterrupt:
-            print("\n\nStopping processing... (Ctrl+C detected)")
-            print("Saving results collected so far...")
-
-        # Batch tag assets after processing
-        tagged_assets = []
-        if immich_client:
-            tagged_assets = self._batch_tag_assets(immich_client, results)
+            # Use tqdm for a progress bar
+            try:
+                for file_path in tqdm(files_to_process, desc="Processing files"):
+                    try:
+                        result_data = self._process_file_in_batch(
+                            file_path, min_frames, detection_threshold, strict_mode,
+                            image_threshold, force_reprocess, quick_sync
+                        )
+                        if result_data:
+                            results.append(result_data)
+                    except Exception as e:
+                        print(f"Error processing {file_path}: {e}")
+                        error_result = self._create_error_result(file_path, str(e))
+                        results.append(error_result)
+                        failed.append((file_path, error_result))
+            except KeyboardInterrupt:
+                print("\n\nStopping processing... (Ctrl+C detected)")
+                print("Saving results collected so far...")
+            finally:
+                self._save_error_results(failed)
+
+            # Batch tag assets after processing
+            if immich_client:
+                tagged_assets = self._batch_tag_assets(immich_client, results)
+        finally:
+            if immich_client:
+                immich_client.close()
 
         # Print Summary
         self._print_summary(results, tagged_assets)
 
+    def _save_error_results(self, failed):
+        """Write the error results of a run to the cache in a single batch."""
+        if not failed or not self.classifier.db:
+            return
+        try:
+            self.classifier.db.save_results(failed)
+        except Exception as e:
+            print(f"Error saving error results to DB: {e}")
+
     def _initialize_immich(self, url, api_key, tag, mappings):
         """Initialize Immich client and tag."""
         if url and api_key:
@@ -98,6 +111,7 @@ class BatchProcessor:
                 return client, tag_id
             else:
                 print(f"Warning: Could not create or find tag '{tag}'. Tagging will be skipped.")
+                client.close()
         return None, None
 
     def _collect_files(self, folder_path):
@@ -159,7 +173,10 @@ class BatchProcessor:
         immich_client.prefetch_asset_path_map()
         
         print("\nResolving asset IDs for tagging...")
-        for result in tqdm(results, desc="Resolving assets"):
+        file_paths = [result.get('file_path') for result in results if result.get('file_path')]
+        asset_ids = immich_client.get_asset_ids_bulk(file_paths)
+
+        for result in results:
             file_path = result.get('file_path')
             if not file_path:
                 continue
@@ -167,8 +184,7 @@ class BatchProcessor:
             confidence = result.get('confidence', 0.0)
             granular_tag_name = self.get_granular_tag(confidence)
             
-            # Get asset ID once for this file
-            asset_id = immich_client.get_asset_id_from_path(file_path)
+            asset_id = asset_ids.get(file_path)
             if not asset_id:
                 print(f"  Warning: Could not find asset in Immich: {file_path}")
                 continue
@@ -178,29 +194,30 @@ class BatchProcessor:
                 tag_to_assets[granular_tag_name].append((file_path, asset_id))
             
             # Add to "Painting" tag group if applicable
-            top_label = result.get('top_label')
-            painting_labels = ["a watercolor painting", "an oil painting", "an acrylic painting"]
-            if top_label in painting_labels:
+            if result.get('top_label') in self.PAINTING_LABELS:
                 tag_to_assets["Painting"].append((file_path, asset_id))
         
-        # Batch tag assets
-        tagged_assets = []
+        # Create/get tags, then tag all groups in parallel (one bulk call per tag)
         print("\nApplying tags in batches...")
-        for tag_name, assets in tqdm(tag_to_assets.items(), desc="Tagging"):
-            # Create/get tag
+        tag_name_to_id = {}
+        for tag_name in tag_to_assets:
             tag_id = immich_client.create_tag_if_not_exists(tag_name)
-            if not tag_id:
-                continue
-            
-            # Extract asset IDs
-            asset_ids = [asset_id for _, asset_id in assets]
-            
-            # Batch tag (skip_existing=True to avoid redundant tagging)
-            success = immich_client.add_tags_to_assets(asset_ids, tag_id, skip_existing=True)
-            
-            if success:
-                # Add to reporting list
-                for file_path, _ in assets:
+            if tag_id:
+                tag_name_to_id[tag_name] = tag_id
+
+        pairs = [
+            (asset_id, tag_name_to_id[tag_name])
+            for tag_name, assets in tag_to_assets.items() if tag_name in tag_name_to_id
+            for _, asset_id in assets
+        ]
+        # skip_existing=True to avoid redundant tagging
+        tag_success = immich_client.tag_assets_bulk(pairs, skip_existing=True)
+
+        # Add to reporting list
+        tagged_assets = []
+        for tag_name, tag_id in tag_name_to_id.items():
+            if tag_success.get(tag_id):
+                for file_path, _ in tag_to_assets[tag_name]:
                     tagged_assets.append(f"{os.path.basename(file_path)} -> {tag_name}")
         
         return tagged_assets
@@ -209,40 +226,22 @@ class BatchProcessor:
         """Tag the asset in Immich with granular and painting tags."""
         if not immich_client:
             return
-            
-        # 1. Applying Granular Tag
-        self._apply_granular_tag(immich_client, file_path, result_data, tagged_assets)
 
-        # 2. Applying Painting Tag
-        self._apply_painting_tag(immich_client, file_path, result_data, tagged_assets)
+        # Decide the tags first so results that need none never touch Immich
+        target_tags = self._get_target_tags_for_result(result_data)
+        if not target_tags:
+            return
+
+        asset_id = immich_client.get_asset_id_from_path(file_path)
+        if not asset_id:
+            return
 
-    def _apply_granular_tag(self, immich_client, file_path, result_data, tagged_assets):
-        """Apply granular tag based on confidence."""
-        confidence = result_data.get('confidence', 0.0)
-        granular_tag_name = self.get_granular_tag(confidence)
-        
-        if granular_tag_name:
-            granular_tag_id = immich_client.create_tag_if_not_exists(granular_tag_name)
-            if granular_tag_id:
-                asset_id = immich_client.get_asset_id_from_path(file_path)
-                if asset_id:
-                    success = immich_client.add_tag_to_asset(asset_id, granular_tag_id)
-                    if success and tagged_assets is not None:
-                        tagged_assets.append(f"{os.path.basename(file_path)} -> {granular_tag_name}")
-
-    def _apply_painting_tag(self, immich_client, file_path, result_data, tagged_assets):
-        """Apply 'Painting' tag if the asset is classified as a painting."""
-        top_label = result_data.get('top_label')
-        painting_labels = ["a watercolor painting", "an oil painting", "an acrylic painting"]
-        
-        if top_label in painting_labels:
-            painting_tag_id = immich_client.create_tag_if_not_exists("Painting")
-            if painting_tag_id:
-                asset_id = immich_client.get_asset_id_from_path(file_path)
-                if asset_id:
-                    success = immich_client.add_tag_to_asset(asset_id, painting_tag_id)
-                    if success and tagged_assets is not None:
-                        tagged_assets.append(f"{os.path.basename(file_path)} -> Painting")
+        for tag_name in target_tags:
+            target_tag_id = immich_client.create_tag_if_not_exists(tag_name)
+            if target_tag_id:
+                success = immich_client.add_tag_to_asset(asset_id, target_tag_id)
+                if success and tagged_assets is not None:
+                    tagged_assets.append(f"{os.path.basename(file_path)} -> {tag_name}")
 
     def _process_file_in_batch(self, file_path, min_frames, detection_threshold,
                              strict_mode, image_threshold, force, quick_sync) -> Optional[Dict]:
@@ -287,7 +286,6 @@ class BatchProcessor:
             print("Error: Immich URL and API key are required")
             return
             
-        immich_client = ImmichClient(immich_url, immich_api_key, immich_path_mappings)
         db = self.classifier.db or self.video_processor.db
         if not db:
             print("Error: Database cache is disabled or not available.")
@@ -303,19 +301,27 @@ class BatchProcessor:
         print(f"Found {len(results)} cached results.")
         valid_results = [r for r in results if r.get('confidence') is not None]
         
-        # Collect assets and their target tags
-        files_to_tag, tag_name_to_id, skipped, errors = self._collect_assets_to_tag(immich_client, valid_results)
-        
-        # Apply tags in batches
-        processed, tagged_details, error_inc = self._apply_batch_tags_from_db(immich_client, files_to_tag, tag_name_to_id)
+        with ImmichClient(immich_url, immich_api_key, immich_path_mappings) as immich_client:
+            # Collect assets and their target tags
+            files_to_tag, tag_name_to_id, skipped, errors = self._collect_assets_to_tag(immich_client, valid_results)
+
+            # Apply tags in batches
+            processed, tagged_details, error_inc = self._apply_batch_tags_from_db(immich_client, files_to_tag, tag_name_to_id)
         
         # Update database
         print(f"Updating database for {len(tagged_details)} files...")
-        for fp, (tag_id, asset_id) in tagged_details:
-            try:
-                db.update_immich_info(fp, tag_id=tag_id, asset_id=asset_id)
-            except Exception as e:
-                print(f"Error updating DB for {fp}: {e}")
+        try:
+            db.update_immich_info_many(
+                (fp, tag_id, asset_id) for fp, (tag_id, asset_id) in tagged_details
+            )
+        except Exception as e:
+            # The batch rolled back as a whole; retry row by row so each failure is reported
+            print(f"Error updating DB in batch, retrying per file: {e}")
+            for fp, (tag_id, asset_id) in tagged_details:
+                try:
+                    db.update_immich_info(fp, tag_id=tag_id, asset_id=asset_id)
+                except Exception as e:
+                    print(f"Error updating DB for {fp}: {e}")
                     
         print("\nSync complete.")
         print(f"Processed: {processed}")
@@ -357,15 +363,12 @@ class BatchProcessor:
     def _get_target_tags_for_result(self, result):
         """Determine which tags should be applied to a result."""
         target_tags = []
-        confidence = result.get('confidence')
-        top_label = result.get('top_label')
-        
-        granular_tag = BatchProcessor.get_granular_tag(confidence)
+
+        granular_tag = BatchProcessor.get_granular_tag(result.get('confidence') or 0.0)
         if granular_tag:
             target_tags.append(granular_tag)
-        
-        painting_labels = ["a watercolor painting", "an oil painting", "an acrylic painting"]
-        if top_label in painting_labels:
+
+        if result.get('top_label') in self.PAINTING_LABELS:
             target_tags.append("Painting")
             
         return target_tags
@@ -1,12 +1,16 @@
+import os
+import numpy as np
 import torch
 from PIL import Image, ImageFile
 ImageFile.LOAD_TRUNCATED_IMAGES = True
 from transformers import SiglipProcessor, SiglipModel  # noqa: E402
-from typing import Union, Dict, Optional  # noqa: E402
+from typing import Union, Dict, List, Optional, Tuple  # noqa: E402
 from .database import DatabaseManager  # noqa: E402
 
 
 class WatercolorClassifier:
+    EMBEDDING_CACHE_SIZE = 4096
+
     def __init__(self, model_name: str = "google/siglip-base-patch16-224", db_path: str = None, use_cache: bool = True):
         """
         Initialize the SigLIP model and processor.
@@ -16,6 +20,10 @@ class WatercolorClassifier:
         if torch.backends.mps.is_available():
             self.device = "mps"
 
+        if self.device == "cuda":
+            # TF32 matmuls on Ampere+ are far faster and plenty precise for zero-shot scores
+            torch.backends.cuda.matmul.allow_tf32 = True
+
         print(f"Loading model {model_name} on {self.device}...")
         self.model = SiglipModel.from_pretrained(model_name).to(self.device)
         self.processor = SiglipProcessor.from_pretrained(model_name)
@@ -37,64 +45,115 @@ class WatercolorClassifier:
         self.use_cache = use_cache
         self.db = DatabaseManager(db_path) if db_path and use_cache else None
 
-    def predict(self, image: Union[str, Image.Image]) -> Dict[str, float]:
+        # Text embeddings never change for a given label set, so encode them once.
+        # Image embeddings are cached per path so threshold/strict re-runs skip the vision encoder.
+        self._text_features = None
+        self._emb_cache: Dict[Tuple[str, int, float], torch.Tensor] = {}
+
+    def _autocast(self):
+        """FP16 autocast for the vision encoder on CUDA; a no-op on CPU and MPS."""
+        return torch.autocast(device_type="cuda", dtype=torch.float16, enabled=self.device == "cuda")
+
+    def _get_text_features(self) -> torch.Tensor:
+        """Encode and L2-normalize the label prompts (computed once per classifier)."""
+        if self._text_features is None:
+            inputs = self.processor(
+                text=self.labels,
+                return_tensors="pt",
+                padding=True
+            ).to(self.device)
+            with torch.inference_mode():
+                text_features = self.model.get_text_features(**inputs)
+            self._text_features = text_features / text_features.norm(p=2, dim=-1, keepdim=True)
+        return self._text_features
+
+    def compute_image_features(self, image: Union[str, Image.Image, np.ndarray]) -> torch.Tensor:
         """
-        Predict the probability of the image being a watercolor painting vs other styles.
+        Compute the L2-normalized image embedding.
+
+        Embeddings for file paths are cached, so re-classifying the same image with
+        different thresholds or in strict mode only runs the vision encoder once.
         """
+        cache_key = None
         if isinstance(image, str):
+            # Key on size and mtime too, so an edited file is re-encoded
+            stat = os.stat(image)
+            cache_key = (image, stat.st_size, stat.st_mtime)
+            if cache_key in self._emb_cache:
+                return self._emb_cache[cache_key]
             image = Image.open(image)
 
-        inputs = self.processor(
-            text=self.labels,
-            images=image,
-            return_tensors="pt",
-            padding=True
-        ).to(self.device)
+        inputs = self.processor(images=image, return_tensors="pt").to(self.device)
+        with torch.inference_mode(), self._autocast():
+            image_features = self.model.get_image_features(**inputs).float()
+        # Keep embeddings on the CPU so cached entries don't pin accelerator memory
+        image_features = (image_features / image_features.norm(p=2, dim=-1, keepdim=True)).cpu()
 
-        with torch.no_grad():
-            outputs = self.model(**inputs)
-            logits_per_image = outputs.logits_per_image  # this is the image-text similarity score
-            probs = logits_per_image.softmax(dim=1)  # we can take the softmax to get the label probabilities
+        if cache_key is not None:
+            if len(self._emb_cache) >= self.EMBEDDING_CACHE_SIZE:
+                # Evict the oldest entry (dicts preserve insertion order)
+                self._emb_cache.pop(next(iter(self._emb_cache)))
+            self._emb_cache[cache_key] = image_features
+        return image_features
 
-        # Convert to dictionary
-        probs_list = probs.cpu().tolist()[0]
-        result = {label: prob for label, prob in zip(self.labels, probs_list)}
-        return result
+    def compute_image_features_batch(self, images: List[Union[Image.Image, np.ndarray]]) -> torch.Tensor:
+        """
+        Compute L2-normalized embeddings for several images in one forward pass.
 
-    def is_watercolor(self, image_path: str, threshold: float = 0.85) -> bool:
+        Unlike compute_image_features, results are not cached; this is meant for
+        in-memory images such as sampled video frames. Arrays must be RGB, HxWx3.
         """
-        Determine if an image is a watercolor painting.
+        inputs = self.processor(images=images, return_tensors="pt").to(self.device)
+        with torch.inference_mode(), self._autocast():
+            image_features = self.model.get_image_features(**inputs).float()
+        return (image_features / image_features.norm(p=2, dim=-1, keepdim=True)).cpu()
 
-        Args:
-            image_path: Path to the image file or PIL Image object.
-            threshold: Minimum probability threshold.
+    def _probs_from_features(self, image_features: torch.Tensor) -> List[Dict[str, float]]:
+        """Turn a batch of image embeddings into one label-probability dict per row."""
+        text_features = self._get_text_features()
+        with torch.inference_mode():
+            logits_per_image = image_features.to(self.device) @ text_features.t() * self.model.logit_scale.exp() + self.model.logit_bias
+            probs = logits_per_image.softmax(dim=1)  # we can take the softmax to get the label probabilities
 
-        Returns:
-            Boolean indicating if the image is classified as watercolor.
+        return [dict(zip(self.labels, row)) for row in probs.cpu().tolist()]
+
+    def predict_from_features(self, image_features: torch.Tensor) -> Dict[str, float]:
         """
-        probs = self.predict(image_path)
-        wc_prob = probs.get("a watercolor painting", 0.0)
+        Turn a precomputed image embedding into label probabilities.
+        """
+        return self._probs_from_features(image_features)[0]
 
-        # Check if watercolor has the highest probability and exceeds threshold
-        return wc_prob > threshold and max(probs, key=probs.get) == "a watercolor painting"
+    def predict(self, image: Union[str, Image.Image, np.ndarray]) -> Dict[str, float]:
+        """
+        Predict the probability of the image being a watercolor painting vs other styles.
+        """
+        return self.predict_from_features(self.compute_image_features(image))
 
-    def is_watercolor_strict(self, image_path: str, threshold: float = 0.85,
-                              min_margin: float = 0.15, max_photo_prob: float = 0.3,
-                              max_digital_prob: float = 0.3) -> bool:
+    def predict_batch(self, images: List[Union[Image.Image, np.ndarray]]) -> List[Dict[str, float]]:
         """
-        Strict watercolor classification with multiple conditions to minimize false positives.
+        Predict label probabilities for several images with a single model call.
 
         Args:
-            image_path: Path to the image file or PIL Image object.
-            threshold: Minimum probability threshold for watercolor.
-            min_margin: Minimum margin between top and second-best category.
-            max_photo_prob: Maximum allowed probability for "photograph" category.
-            max_digital_prob: Maximum allowed probability for "digital art" category.
+            images: PIL images or RGB HxWx3 arrays to classify.
 
         Returns:
-            Boolean indicating if the image passes all strict watercolor checks.
+            One probability dictionary per image, in input order.
         """
-        probs = self.predict(image_path)
+        if not images:
+            return []
+        return self._probs_from_features(self.compute_image_features_batch(images))
+
+    @staticmethod
+    def decide_watercolor(probs: Dict[str, float], threshold: float = 0.85) -> bool:
+        """Apply the basic watercolor decision to a probability dictionary."""
+        wc_prob = probs.get("a watercolor painting", 0.0)
+        return wc_prob > threshold and max(probs, key=probs.get) == "a watercolor painting"
+
+    @staticmethod
+    def decide_watercolor_strict(probs: Dict[str, float], threshold: float = 0.85,
+                                 min_margin: float = 0.15, max_photo_prob: float = 0.3,
+                                 max_digital_prob: float = 0.3) -> bool:
+        """Apply the strict multi-condition watercolor decision to a probability dictionary."""
         wc_prob = probs.get("a watercolor painting", 0.0)
 
         # Condition 1: Watercolor must be highest
@@ -120,6 +179,47 @@ class WatercolorClassifier:
 
         return True
 
+    def is_watercolor(self, image_path: str, threshold: float = 0.85) -> bool:
+        """
+        Determine if an image is a watercolor painting.
+
+        Args:
+            image_path: Path to the image file or PIL Image object.
+            threshold: Minimum probability threshold.
+
+        Returns:
+            Boolean indicating if the image is classified as watercolor.
+        """
+        probs = self.predict(image_path)
+
+        # Check if watercolor has the highest probability and exceeds threshold
+        return self.decide_watercolor(probs, threshold)
+
+    def is_watercolor_strict(self, image_path: str, threshold: float = 0.85,
+                              min_margin: float = 0.15, max_photo_prob: float = 0.3,
+                              max_digital_prob: float = 0.3) -> bool:
+        """
+        Strict watercolor classification with multiple conditions to minimize false positives.
+
+        Args:
+            image_path: Path to the image file or PIL Image object.
+            threshold: Minimum probability threshold for watercolor.
+            min_margin: Minimum margin between top and second-best category.
+            max_photo_prob: Maximum allowed probability for "photograph" category.
+            max_digital_prob: Maximum allowed probability for "digital art" category.
+
+        Returns:
+            Boolean indicating if the image passes all strict watercolor checks.
+        """
+        probs = self.predict(image_path)
+        return self.decide_watercolor_strict(probs, threshold, min_margin, max_photo_prob, max_digital_prob)
+
+    def _decide(self, probs: Dict[str, float], threshold: float, strict_mode: bool) -> bool:
+        """Pick the strict or basic decision function for the given probabilities."""
+        if strict_mode:
+            return self.decide_watercolor_strict(probs, threshold)
+        return self.decide_watercolor(probs, threshold)
+
     def classify_with_cache(self, image_path: str, threshold: float = 0.85,
                            strict_mode: bool = False, force: bool = False,
                            quick_sync: bool = False) -> Dict:
@@ -128,12 +228,8 @@ class WatercolorClassifier:
         """
         # Skip cache if not a file path
         if not isinstance(image_path, str):
-            if strict_mode:
-                is_wc = self.is_watercolor_strict(image_path, threshold)
-            else:
-                is_wc = self.is_watercolor(image_path, threshold)
-            
             probs = self.predict(image_path)
+            is_wc = self._decide(probs, threshold, strict_mode)
             return {
                 'file_path': None,
                 'file_type': 'image',
@@ -151,13 +247,9 @@ class WatercolorClassifier:
             if not needs_processing:
                 return cached
         
-        # Process image
-        if strict_mode:
-            is_wc = self.is_watercolor_strict(image_path, threshold)
-        else:
-            is_wc = self.is_watercolor(image_path, threshold)
-        
+        # Process image (single forward pass; decision is made on the probabilities)
         probs = self.predict(image_path)
+        is_wc = self._decide(probs, threshold, strict_mode)
         
         result = {
             'file_path': image_path,
@@ -2,7 +2,7 @@ import sqlite3
 import hashlib
 import os
 from datetime import datetime
-from typing import Optional, Dict, Tuple, Any
+from typing import Optional, Dict, Tuple, Any, Iterable
 from pathlib import Path
 
 
@@ -27,6 +27,11 @@ class DatabaseManager:
         """Establish database connection."""
         self.conn = sqlite3.connect(self.db_path)
         self.conn.row_factory = sqlite3.Row  # Enable column access by name
+        # WAL with synchronous=NORMAL fsyncs at checkpoints rather than on every
+        # commit, which is what makes per-file result saves cheap during a scan
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
 
     def _init_schema(self):
         """Create database tables and indexes if they don't exist."""
@@ -119,12 +124,8 @@ class DatabaseManager:
         Returns:
             Hex digest of file hash
         """
-        sha256_hash = hashlib.sha256()
         with open(file_path, "rb") as f:
-            # Read file in chunks to handle large files
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256_hash.update(chunk)
-        return sha256_hash.hexdigest()
+            return hashlib.file_digest(f, "sha256").hexdigest()
 
     def get_file_info(self, file_path: str) -> Tuple[int, float]:
         """
@@ -241,6 +242,23 @@ class DatabaseManager:
             file_path: Path to file
             result_data: Dictionary containing classification results
         """
+        self._write_result(self.conn.cursor(), file_path, result_data)
+        self.conn.commit()
+
+    def save_results(self, results: Iterable[Tuple[str, Dict[str, Any]]]):
+        """
+        Save several classification results in a single transaction.
+
+        Args:
+            results: Iterable of (file_path, result_data) pairs
+        """
+        with self.conn:
+            cursor = self.conn.cursor()
+            for file_path, result_data in results:
+                self._write_result(cursor, file_path, result_data)
+
+    def _write_result(self, cursor: sqlite3.Cursor, file_path: str, result_data: Dict[str, Any]):
+        """Insert or update one result row without committing."""
         # Calculate file info
         file_hash = self.calculate_file_hash(file_path)
         file_size, file_mtime = self.get_file_info(file_path)
@@ -248,8 +266,6 @@ class DatabaseManager:
         # Normalize path
         normalized_path = os.path.normpath(file_path)
 
-        cursor = self.conn.cursor()
-
         # Check if entry exists
         cursor.execute("""
             SELECT id FROM classification_results
@@ -327,8 +343,6 @@ class DatabaseManager:
                 self.VERSION
             ))
 
-        self.conn.commit()
-
     def delete_record(self, file_path: str):
         """
         Delete a classification record.
@@ -446,6 +460,22 @@ class DatabaseManager:
         """, (tag_id, asset_id, os.path.normpath(file_path)))
         self.conn.commit()
 
+    def update_immich_info_many(self, entries: Iterable[Tuple[str, Optional[str], Optional[str]]]):
+        """
+        Update Immich integration information for many files in one transaction.
+
+        Args:
+            entries: Iterable of (file_path, tag_id, asset_id) tuples
+        """
+        with self.conn:
+            self.conn.executemany("""
+                UPDATE classification_results SET
+                    immich_tagged = 1,
+                    immich_tag_id = ?,
+                    immich_asset_id = ?
+                WHERE file_path = ?
+            """, ((tag_id, asset_id, os.path.normpath(fp)) for fp, tag_id, asset_id in entries))
+
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get database statistics.
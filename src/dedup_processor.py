@@ -5,7 +5,7 @@ This module contains the DedupProcessor class responsible for processing
 and managing duplicate detection and removal in the Immich system.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from src.immich_client import ImmichClient
 import logging
 
@@ -92,39 +92,19 @@ class DedupProcessor:
 
         return len(to_del_ids)
 
+    def _priority_key(self, asset: Dict) -> Tuple[int, int]:
+        """Rank an asset: Picture Library > Internal > External, then larger file first."""
+        path = asset.get('originalPath', '')
+        if self.picture_library_path and path.startswith(self.picture_library_path):
+            tier = 2
+        elif path.startswith(self.internal_path):
+            tier = 1
+        else:
+            tier = 0
+        return tier, self._get_file_size(asset)
+
     def _analyze_group(self, assets_in_group: List[Dict]) -> List[Dict]:
         """Analyze a duplicate group and determine which assets to delete based on priority."""
-        external: List[Dict] = []
-        picture_library_assets: List[Dict] = []
-        internal: List[Dict] = []
-        
-        for asset in assets_in_group:
-            path = asset.get('originalPath', '')
-            if self.picture_library_path and path.startswith(self.picture_library_path):
-                picture_library_assets.append(asset)
-            elif path.startswith(self.internal_path):
-                internal.append(asset)
-            else:
-                external.append(asset)
-
-        group_to_del: List[Dict] = []
-
-        # 1. Picture Library
-        if picture_library_assets:
-            winner = max(picture_library_assets, key=self._get_file_size)
-            group_to_del.extend([a for a in picture_library_assets if a['id'] != winner['id']])
-            group_to_del.extend(internal)
-            group_to_del.extend(external)
-        
-        # 2. Internal
-        elif internal:
-            winner = max(internal, key=self._get_file_size)
-            group_to_del.extend([a for a in internal if a['id'] != winner['id']])
-            group_to_del.extend(external)
-            
-        # 3. External
-        elif external:
-            winner = max(external, key=self._get_file_size)
-            group_to_del.extend([a for a in external if a['id'] != winner['id']])
-
-        return group_to_del
+        # One pass picks the best-ranked asset; everything else in the group is a duplicate
+        winner = max(assets_in_group, key=self._priority_key)
+        return [a for a in assets_in_group if a['id'] != winner['id']]
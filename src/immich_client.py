@@ -1,10 +1,158 @@
+import functools
+import logging
 import requests
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from tqdm import tqdm
 from typing import Optional, Dict
 
+logger = logging.getLogger(__name__)
+
+# Resolved once at import; checked on every path translation
+_IS_NT = os.name == 'nt'
+
+
+class _LocalPrefixIndex:
+    """
+    Local mapping prefixes indexed for longest-prefix lookup.
+
+    A prefix only matches at a '/' boundary, so the candidates for a path are the
+    path itself and each of its parent directories. Looking those up in a dict costs
+    O(depth) however many mappings there are. Instances hash by identity, which keeps
+    them cheap lru_cache keys.
+    """
+    __slots__ = ('_exact', '_folded')
+
+    def __init__(self, entries):
+        # entries are (local_forward, local_forward_lower, remote), longest prefix first;
+        # setdefault keeps the first of any prefixes that collide
+        self._exact = {}
+        self._folded = {}
+        for entry in entries:
+            self._exact.setdefault(entry[0], entry)
+            self._folded.setdefault(entry[1], entry)
+
+    def match(self, path: str, case_insensitive: bool) -> Optional[tuple]:
+        """Return the entry for the longest mapped prefix of path (lowercased if case_insensitive)."""
+        return _match_longest_prefix(self._folded if case_insensitive else self._exact, path)
+
+
+class _RemotePrefixIndex:
+    """
+    Remote (Immich) mapping prefixes indexed for longest-prefix lookup.
+
+    The reverse of _LocalPrefixIndex: Immich paths are case-sensitive and always use
+    forward slashes, so a single table keyed by the prefix without its trailing slash
+    is enough. Hashes by identity for the same reason.
+    """
+    __slots__ = ('_table',)
+
+    def __init__(self, entries):
+        # entries are (remote_forward, local, sep), longest prefix first
+        self._table = {}
+        for entry in entries:
+            self._table.setdefault(entry[0].rstrip('/'), entry)
+
+    def match(self, path: str) -> Optional[tuple]:
+        """Return the entry for the longest mapped prefix of path."""
+        return _match_longest_prefix(self._table, path)
+
+
+def _match_longest_prefix(table: dict, path: str) -> Optional[tuple]:
+    """Look up path and then each of its parent directories in table, longest first."""
+    if not table:
+        return None
+    end = len(path)
+    while end >= 0:
+        entry = table.get(path[:end])
+        if entry:
+            return entry
+        end = path.rfind('/', 0, end)
+    return None
+
+
+@functools.lru_cache(maxsize=65536)
+def _translate_path(local_path: str, local_prefixes: '_LocalPrefixIndex', is_nt: bool) -> str:
+    """
+    Translate a local file path to an Immich originalPath.
+
+    Pure function of its arguments so repeated lookups are served from the LRU cache.
+    """
+    local_path_forward = local_path.replace('\\', '/')
+    
+    # Default: just ensure all slashes are forward
+    translated_path = local_path_forward
+
+    # Case-insensitive if it looks like a Windows path (drive letter or unc)
+    is_windows_path = ':' in local_path_forward or local_path_forward.startswith('//')
+    case_insensitive = is_nt or is_windows_path
+    # Lowercase the path once; the index keeps a pre-lowered copy of each prefix
+    local_path_lower = local_path_forward.lower() if case_insensitive else None
+
+    entry = local_prefixes.match(local_path_lower if case_insensitive else local_path_forward,
+                                 case_insensitive)
+    if entry:
+        local_prefix_forward, _, remote_prefix_clean = entry
+        relative_path = local_path_forward[len(local_prefix_forward):].lstrip('/')
+
+        if remote_prefix_clean.endswith('/'):
+            translated_path = remote_prefix_clean + relative_path
+        else:
+            translated_path = remote_prefix_clean + '/' + relative_path
+    
+    # Final cleanup: collapse multiple slashes
+    is_abs = translated_path.startswith('/')
+    parts = [p for p in translated_path.split('/') if p]
+    translated_path = '/'.join(parts)
+    if is_abs:
+        translated_path = '/' + translated_path
+        
+    return translated_path
+
+
+@functools.lru_cache(maxsize=65536)
+def _reverse_path(immich_path: str, remote_prefixes: _RemotePrefixIndex) -> Optional[str]:
+    """Convert Immich server path to local file path (cached, see _translate_path)."""
+    # Immich paths always use forward slashes
+    entry = remote_prefixes.match(immich_path)
+    if not entry:
+        return None
+    remote_prefix_forward, local_prefix, sep = entry
+
+    # Remove server prefix and leading slash
+    relative_path = immich_path[len(remote_prefix_forward):].lstrip('/')
+
+    # Replace forward slashes with chosen separator
+    relative_path = relative_path.replace('/', sep)
+
+    # Combine using chosen separator
+    if local_prefix.endswith(sep):
+        local_path = local_prefix + relative_path
+    else:
+        local_path = local_prefix + sep + relative_path
+
+    return os.path.normpath(local_path)
+
 
 class ImmichClient:
     PAGE_SIZE = 1000
+    # Number of pages requested concurrently once pagination goes past page 1
+    PAGE_WINDOW = 4
+    # Seconds a fetched tag-membership set is trusted by add_tags_to_assets
+    TAG_MEMBERS_TTL = 300
+    # Maximum number of asset IDs sent in one bulk PUT/DELETE body
+    BATCH_SIZE = 500
+    # Transient failures are retried with exponential backoff, honouring Retry-After
+    RETRY = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+        raise_on_status=False
+    )
 
     def __init__(self, url: str, api_key: str, path_mappings: Dict[str, str] = None):
         self.url = url.rstrip('/')
@@ -15,12 +163,73 @@ class ImmichClient:
             for local, remote in path_mappings.items():
                 self.path_mappings[os.path.normpath(local)] = remote
 
+        # Prefix tables for both directions, longest prefix first so nested mappings
+        # resolve to the most specific entry; local prefixes keep a lowercased copy
+        # for case-insensitive (Windows) matching
+        self._local_prefixes = _LocalPrefixIndex(sorted(
+            ((local.replace('\\', '/'), local.replace('\\', '/').lower(), remote.replace('\\', '/'))
+             for local, remote in self.path_mappings.items()),
+            key=lambda entry: len(entry[0]),
+            reverse=True
+        ))
+        self._remote_prefixes = _RemotePrefixIndex(sorted(
+            ((remote.replace('\\', '/'), local, self._local_separator(local))
+             for local, remote in self.path_mappings.items()),
+            key=lambda entry: len(entry[0]),
+            reverse=True
+        ))
+
+        # Endpoint URLs are fixed per client; build them once
+        self._u_search_meta = f"{self.url}/api/search/metadata"
+        self._u_assets = f"{self.url}/api/assets"
+        self._u_asset_legacy = f"{self.url}/api/asset"
+        self._u_tags = f"{self.url}/api/tags"
+        self._u_tag_assets_tpl = f"{self.url}/api/tags/{{}}/assets"
+        self._u_trash_empty = f"{self.url}/api/trash/empty"
+        self._u_duplicates = f"{self.url}/api/duplicates"
+
         self.headers = {
             'x-api-key': api_key,
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         }
         self._asset_path_map = None
+        # Asset-listing endpoint this server answered on, detected on first use
+        self._assets_endpoint: Optional[str] = None
+        # True once a prefetch loaded every page, making a map miss final
+        self._map_authoritative = False
+        # Tag name -> ID, loaded lazily from a single pass over /api/tags
+        self._tag_cache: Optional[Dict[str, str]] = None
+        # ETag of the last single-page tag listing, used to revalidate on reload
+        self._tags_etag: Optional[str] = None
+        # Set by invalidate_tag_cache: the map must be revalidated before its next use
+        self._tag_cache_stale = False
+        # Tag ID -> IDs of assets already carrying it, with fetch time for TTL expiry
+        self._tag_members: Dict[str, set] = {}
+        self._tag_members_ts: Dict[str, float] = {}
+
+        # Reuse one pooled session so every call shares keep-alive connections
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=self.RETRY
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+    def close(self):
+        """Release pooled HTTP connections."""
+        self._session.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
 
     def get_asset_id_from_path(self, file_path: str) -> Optional[str]:
         """
@@ -30,155 +239,174 @@ class ImmichClient:
         if self._asset_path_map is not None:
             translated_path = self.translate_path_to_immich(file_path)
             asset_id = self._find_asset_in_cache(translated_path)
-            if asset_id:
+            if asset_id or self._map_authoritative:
                 return asset_id
 
         # Fallback to metadata search
         return self._search_asset_by_metadata(file_path)
 
+    def get_asset_ids_bulk(self, paths: list, max_workers: int = 16) -> Dict[str, Optional[str]]:
+        """
+        Resolve many local paths to asset IDs, overlapping the HTTP lookups.
+
+        Args:
+            paths: Local file paths to resolve
+            max_workers: Number of concurrent lookups
+
+        Returns:
+            Dictionary mapping each local path to its asset ID (or None if not found)
+        """
+        unique_paths = list(dict.fromkeys(paths))
+        asset_ids: Dict[str, Optional[str]] = {}
+        misses = []
+
+        with tqdm(total=len(unique_paths), desc="Resolving assets") as pbar:
+            # Prefetched map hits are plain dict lookups; keep them on this thread
+            for path in unique_paths:
+                asset_id = None
+                if self._asset_path_map is not None:
+                    asset_id = self._find_asset_in_cache(self.translate_path_to_immich(path))
+                if asset_id:
+                    asset_ids[path] = asset_id
+                    pbar.update(1)
+                else:
+                    misses.append(path)
+
+            # Only cache misses need a metadata search round-trip, and only when
+            # the map is incomplete
+            if self._asset_path_map is not None and self._map_authoritative:
+                for path in misses:
+                    asset_ids[path] = None
+                pbar.update(len(misses))
+            elif misses:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for path, asset_id in zip(misses, executor.map(self._search_asset_by_metadata, misses)):
+                        asset_ids[path] = asset_id
+                        pbar.update(1)
+
+        return asset_ids
+
     def _find_asset_in_cache(self, translated_path: str) -> Optional[str]:
         """Look for translated path in the cached asset map."""
-        asset_id = self._asset_path_map.get(translated_path)
-        if asset_id:
-            return asset_id
-        
-        # Try with/without leading slash
-        if translated_path.startswith('/'):
-            return self._asset_path_map.get(translated_path[1:])
-        else:
-            return self._asset_path_map.get('/' + translated_path)
+        return self._asset_path_map.get(self._canonical_path(translated_path))
+
+    @staticmethod
+    def _canonical_path(path: str) -> str:
+        """Cache key for an Immich path: always with a single leading slash."""
+        return path if path.startswith('/') else '/' + path
 
     def _search_asset_by_metadata(self, file_path: str) -> Optional[str]:
         """Search for asset using API metadata search."""
-        translated_path = self.translate_path_to_immich(file_path)
-        
-        # Paths to try (original, without leading slash, with leading slash)
-        paths_to_try = [translated_path]
-        if translated_path.startswith('/'):
-            paths_to_try.append(translated_path[1:])
-        else:
-            paths_to_try.append('/' + translated_path)
-
-        for path in paths_to_try:
-            try:
-                search_url = f"{self.url}/api/search/metadata"
-                response = requests.post(
-                    search_url,
-                    json={"originalPath": path},
-                    headers=self.headers
-                )
+        translated_path = self._canonical_path(self.translate_path_to_immich(file_path))
 
-                if response.status_code == 200:
-                    results = response.json()
-                    assets = results.get('assets', {}).get('items', [])
-                    if assets and assets[0].get('originalPath') == path:
-                        return assets[0]['id']
-            except Exception as e:
-                print(f"Error searching for asset {file_path} at path {path}: {e}")
+        try:
+            response = self._session.post(
+                self._u_search_meta,
+                # An exact path matches at most one asset; skip EXIF to keep the body small
+                json={"originalPath": translated_path, "size": 1, "withExif": False}
+            )
+
+            if response.status_code == 200:
+                results = response.json()
+                assets = results.get('assets', {}).get('items', [])
+                if assets and assets[0].get('originalPath') == translated_path:
+                    return assets[0]['id']
+        except requests.RequestException as e:
+            logger.warning("Error searching for asset %s at path %s: %s", file_path, translated_path, e)
         return None
 
     def translate_path_to_immich(self, local_path: str) -> str:
         """Translate a local file path to an Immich originalPath."""
-        local_path_forward = local_path.replace('\\', '/')
-        
-        # Default: just ensure all slashes are forward
-        translated_path = local_path_forward
-
-        for local_prefix, remote_prefix in self.path_mappings.items():
-            local_prefix_forward = local_prefix.replace('\\', '/')
-            
-            # Case-insensitive if it looks like a Windows path (drive letter or unc)
-            is_windows_path = ':' in local_path_forward or local_path_forward.startswith('//')
-            if os.name == 'nt' or is_windows_path:
-                prefix_matches = local_path_forward.lower().startswith(local_prefix_forward.lower())
-            else:
-                prefix_matches = local_path_forward.startswith(local_prefix_forward)
-
-            if prefix_matches:
-                # Ensure it's a true prefix match by checking separator at boundary
-                if len(local_path_forward) > len(local_prefix_forward):
-                    if local_path_forward[len(local_prefix_forward)] != '/':
-                        continue
-                
-                relative_path = local_path_forward[len(local_prefix_forward):].lstrip('/')
-                remote_prefix_clean = remote_prefix.replace('\\', '/')
-                
-                if remote_prefix_clean.endswith('/'):
-                    translated_path = remote_prefix_clean + relative_path
-                else:
-                    translated_path = remote_prefix_clean + '/' + relative_path
-                break
-        
-        # Final cleanup: collapse multiple slashes
-        is_abs = translated_path.startswith('/')
-        parts = [p for p in translated_path.split('/') if p]
-        translated_path = '/'.join(parts)
-        if is_abs:
-            translated_path = '/' + translated_path
-            
-        return translated_path
+        return _translate_path(local_path, self._local_prefixes, _IS_NT)
 
     def prefetch_asset_path_map(self):
         """Pre-fetch all assets from Immich and build a path -> ID map for performance."""
         print("Pre-fetching asset list from Immich for performance optimization...")
         self._asset_path_map = {}
-        page = 1
-        page_size = self.PAGE_SIZE
-        
-        while True:
-            try:
-                response = self._fetch_assets_page(page, page_size)
-                if response is None or response.status_code != 200:
-                    if response:
-                        print(f"Error fetching assets (page {page}): HTTP {response.status_code}")
-                    break
-                
-                results = response.json()
-                assets = self._parse_assets_from_response(results)
-                
-                if not assets:
-                    break
-                
-                for asset in assets:
-                    path = asset.get('originalPath')
-                    if path:
-                        self._asset_path_map[path] = asset.get('id')
-                
-                if len(assets) < page_size:
-                    break
-                page += 1
-                
-            except Exception as e:
-                print(f"Error pre-fetching assets: {e}")
-                break
+        self._map_authoritative = False
+        failed_pages = []
+
+        def fetch_page(page):
+            items = self._fetch_asset_page_items(page)
+            if items is None:
+                failed_pages.append(page)
+            return items
+
+        for assets in self._iter_pages(fetch_page):
+            for asset in assets:
+                path = asset.get('originalPath')
+                if path:
+                    self._asset_path_map[self._canonical_path(path)] = asset.get('id')
+        # A partial map (some page failed) still needs the metadata-search fallback
+        self._map_authoritative = not failed_pages
         print(f"Loaded {len(self._asset_path_map)} assets into path map.")
 
+    def _iter_pages(self, fetch_page):
+        """
+        Yield pages of items in order, fetching up to PAGE_WINDOW pages concurrently.
+
+        The first page is fetched alone so small libraries cost a single request.
+        Iteration stops at the first failed (None), empty or short page.
+        """
+        items = fetch_page(1)
+        if not items:
+            return
+        yield items
+        if len(items) < self.PAGE_SIZE:
+            return
+
+        page = 2
+        with ThreadPoolExecutor(max_workers=self.PAGE_WINDOW) as executor:
+            while True:
+                window = range(page, page + self.PAGE_WINDOW)
+                for items in executor.map(fetch_page, window):
+                    if not items:
+                        return
+                    yield items
+                    if len(items) < self.PAGE_SIZE:
+                        return
+                page += self.PAGE_WINDOW
+
+    def _fetch_asset_page_items(self, page: int) -> Optional[list]:
+        """Fetch one page of the full asset list, returning None on failure."""
+        try:
+            response = self._fetch_assets_page(page, self.PAGE_SIZE)
+            if response is None or response.status_code != 200:
+                if response is not None:
+                    logger.warning("Error fetching assets (page %d): HTTP %s", page, response.status_code)
+                return None
+            return self._parse_assets_from_response(response.json())
+        except requests.RequestException as e:
+            logger.warning("Error pre-fetching assets: %s", e)
+            return None
+
     def _fetch_assets_page(self, page: int, page_size: int):
-        """Fetch a single page of assets from Immich, handles falling back to old endpoints."""
+        """
+        Fetch a single page of assets from Immich, handles falling back to old endpoints.
+
+        The endpoint that first answers 200 is remembered, so later pages skip the probe.
+        """
+        params = {"skip": (page - 1) * page_size, "take": page_size}
+        # (endpoint, request, status codes that mean "try the next endpoint")
+        attempts = (
+            (self._u_search_meta,
+             lambda: self._session.post(self._u_search_meta, json={"page": page, "size": page_size, "withExif": False}),
+             (404, 405)),
+            (self._u_assets, lambda: self._session.get(self._u_assets, params=params), (404,)),
+            (self._u_asset_legacy, lambda: self._session.get(self._u_asset_legacy, params=params), ()),
+        )
         try:
-            # Try POST /api/search/metadata
-            response = requests.post(
-                f"{self.url}/api/search/metadata",
-                headers=self.headers,
-                json={"page": page, "size": page_size, "withExif": False}
-            )
-            
-            if response.status_code in (404, 405):
-                # Try GET /api/assets
-                response = requests.get(
-                    f"{self.url}/api/assets",
-                    headers=self.headers,
-                    params={"skip": (page - 1) * page_size, "take": page_size}
-                )
-                if response.status_code == 404:
-                    # Try GET /api/asset
-                    response = requests.get(
-                        f"{self.url}/api/asset",
-                        headers=self.headers,
-                        params={"skip": (page - 1) * page_size, "take": page_size}
-                    )
-            return response
-        except Exception:
+            for endpoint, request, fall_through in attempts:
+                if self._assets_endpoint not in (None, endpoint):
+                    continue
+                response = request()
+                if self._assets_endpoint is None and response.status_code in fall_through:
+                    continue
+                if response.status_code == 200:
+                    self._assets_endpoint = endpoint
+                return response
+            return None
+        except requests.RequestException:
             return None
 
     def _parse_assets_from_response(self, results) -> list:
@@ -194,30 +422,15 @@ class ImmichClient:
                 return results['assets']
         return []
 
+    @staticmethod
+    def _local_separator(local_prefix: str) -> str:
+        """Choose local separator: use \\ if local_prefix looks like Windows."""
+        is_windows = _IS_NT or ':' in local_prefix or local_prefix.startswith('\\\\')
+        return '\\' if is_windows else '/'
+
     def reverse_path_mapping(self, immich_path: str) -> Optional[str]:
         """Convert Immich server path to local file path."""
-        # Immich paths always use forward slashes
-        for local_prefix, remote_prefix in self.path_mappings.items():
-            remote_prefix_forward = remote_prefix.replace('\\', '/')
-            if immich_path.startswith(remote_prefix_forward):
-                # Remove server prefix and leading slash
-                relative_path = immich_path[len(remote_prefix_forward):].lstrip('/')
-
-                # Choose local separator: use \ if local_prefix looks like Windows
-                is_windows = os.name == 'nt' or ':' in local_prefix or local_prefix.startswith('\\\\')
-                sep = '\\' if is_windows else '/'
-                
-                # Replace forward slashes with chosen separator
-                relative_path = relative_path.replace('/', sep)
-
-                # Combine using chosen separator
-                if local_prefix.endswith(sep):
-                    local_path = local_prefix + relative_path
-                else:
-                    local_path = local_prefix + sep + relative_path
-
-                return os.path.normpath(local_path)
-        return None
+        return _reverse_path(immich_path, self._remote_prefixes)
 
     def create_tag_if_not_exists(self, tag_name: str) -> Optional[str]:
         """
@@ -230,32 +443,67 @@ class ImmichClient:
                 return tag_id
 
             # Create it
-            response = requests.post(
-                f"{self.url}/api/tags",
-                json={"name": tag_name},
-                headers=self.headers
+            response = self._session.post(
+                self._u_tags,
+                json={"name": tag_name}
             )
             if response.status_code in (200, 201):
-                return response.json()['id']
+                tag_id = response.json()['id']
+                self._tag_cache[tag_name] = tag_id
+                return tag_id
             elif response.status_code == 409:
-                return self.create_tag_if_not_exists(tag_name)
+                # Created elsewhere since the cache was loaded, so the list has changed;
+                # reload it unconditionally and look the tag up
+                self._tag_cache = self._load_tag_cache(revalidate=False)
+                self._tag_cache_stale = False
+                return self._tag_cache.get(tag_name)
             else:
-                print(f"Failed to create tag {tag_name}: {response.status_code} - {response.text}")
+                logger.warning("Failed to create tag %s: %s - %s", tag_name, response.status_code, response.text)
 
-        except Exception as e:
-            print(f"Error creating tag {tag_name}: {e}")
+        except requests.RequestException as e:
+            logger.warning("Error creating tag %s: %s", tag_name, e)
 
         return None
 
+    def invalidate_tag_cache(self):
+        """
+        Mark the cached tag map stale, e.g. after tags may have changed outside this client.
+
+        The next lookup reloads it; the map and its ETag are kept so that reload is a
+        conditional GET and an unchanged list costs a 304 rather than a full listing.
+        """
+        self._tag_cache_stale = True
+
     def _find_tag_by_name(self, tag_name: str) -> Optional[str]:
-        """List tags and find one by name."""
+        """Find a tag ID by name using the cached tag map."""
+        if self._tag_cache is None or self._tag_cache_stale:
+            self._tag_cache = self._load_tag_cache()
+            self._tag_cache_stale = False
+        return self._tag_cache.get(tag_name)
+
+    def _load_tag_cache(self, revalidate: bool = True) -> Dict[str, str]:
+        """
+        List all tags once and return a name -> ID map.
+
+        Args:
+            revalidate: When the previous listing fit in one page and the server sent
+                an ETag, make the reload a conditional GET so a 304 keeps the current
+                map. Pass False when the list is known to have changed.
+        """
+        tag_map = {}
         page = 1
         while True:
-            response = requests.get(
-                f"{self.url}/api/tags",
-                headers=self.headers,
-                params={"page": page, "size": self.PAGE_SIZE}
-            )
+            params = {"page": page, "size": self.PAGE_SIZE}
+            if page == 1 and revalidate and self._tags_etag and self._tag_cache is not None:
+                response = self._session.get(
+                    self._u_tags,
+                    params=params,
+                    headers={'If-None-Match': self._tags_etag}
+                )
+                if response.status_code == 304:
+                    return self._tag_cache
+            else:
+                response = self._session.get(self._u_tags, params=params)
             
             if response.status_code != 200:
                 break
@@ -267,13 +515,14 @@ class ImmichClient:
                 break
                 
             for tag in tags:
-                if tag['name'] == tag_name:
-                    return tag['id']
+                tag_map[tag['name']] = tag['id']
             
             if len(tags) < self.PAGE_SIZE:
+                # A single ETag only validates the whole list when it fit in one page
+                self._tags_etag = response.headers.get('ETag') if page == 1 else None
                 break
             page += 1
-        return None
+        return tag_map
 
     def add_tag_to_asset(self, asset_id: str, tag_id: str) -> bool:
         """
@@ -281,14 +530,13 @@ class ImmichClient:
         """
         try:
             # PUT /api/tags/{id}/assets
-            response = requests.put(
-                f"{self.url}/api/tags/{tag_id}/assets",
-                json={"ids": [asset_id]},
-                headers=self.headers
+            response = self._session.put(
+                self._u_tag_assets_tpl.format(tag_id),
+                json={"ids": [asset_id]}
             )
             return response.status_code in (200, 201)
-        except Exception as e:
-            print(f"Error adding tag to asset {asset_id}: {e}")
+        except requests.RequestException as e:
+            logger.warning("Error adding tag to asset %s: %s", asset_id, e)
             return False
 
     def add_tags_to_assets(self, asset_ids: list, tag_id: str, skip_existing: bool = True) -> bool:
@@ -309,77 +557,114 @@ class ImmichClient:
         try:
             # If skip_existing, get current assets with this tag and filter them out
             if skip_existing:
-                existing_assets = self.get_assets_by_tag(tag_id)
-                existing_ids = {asset['id'] for asset in existing_assets}
+                existing_ids = self._get_tag_member_ids(tag_id)
                 asset_ids = [aid for aid in asset_ids if aid not in existing_ids]
                 
                 if not asset_ids:
                     # All assets already have this tag
                     return True
             
-            # PUT /api/tags/{id}/assets with multiple IDs
-            response = requests.put(
-                f"{self.url}/api/tags/{tag_id}/assets",
-                json={"ids": asset_ids},
-                headers=self.headers
-            )
-            
-            if response.status_code not in (200, 201):
-                print(f"Error adding tag to assets: HTTP {response.status_code}")
-                try:
-                    print(f"Server response: {response.text}")
-                except Exception:
-                    pass
-                return False
-                
-            return True
-        except Exception as e:
-            print(f"Exception adding tag to assets: {e}")
+            # PUT /api/tags/{id}/assets with multiple IDs, BATCH_SIZE IDs per request
+            return self._send_in_chunks(lambda chunk: self._put_tag_assets(tag_id, chunk), asset_ids)
+        except requests.RequestException as e:
+            logger.warning("Exception adding tag to assets: %s", e)
             return False
 
+    def _put_tag_assets(self, tag_id: str, asset_ids: list) -> bool:
+        """Tag one chunk of assets; helper for add_tags_to_assets."""
+        response = self._session.put(
+            self._u_tag_assets_tpl.format(tag_id),
+            json={"ids": asset_ids}
+        )
+        
+        if response.status_code not in (200, 201):
+            logger.warning("Error adding tag to assets: HTTP %s - %s", response.status_code, response.text)
+            return False
+
+        # Keep the cached membership current so later batches don't re-fetch it
+        if tag_id in self._tag_members:
+            self._tag_members[tag_id].update(asset_ids)
+        return True
+
+    def _send_in_chunks(self, send, ids: list) -> bool:
+        """
+        Split ids into BATCH_SIZE chunks and send them, concurrently when there are several.
+
+        Returns True only if every chunk succeeded.
+        """
+        chunks = [ids[i:i + self.BATCH_SIZE] for i in range(0, len(ids), self.BATCH_SIZE)]
+        if len(chunks) == 1:
+            return send(chunks[0])
+        with ThreadPoolExecutor(max_workers=min(len(chunks), self.PAGE_WINDOW)) as executor:
+            return all(list(executor.map(send, chunks)))
+
+    def _get_tag_member_ids(self, tag_id: str) -> set:
+        """Return IDs of assets carrying the tag, refreshed after TAG_MEMBERS_TTL seconds."""
+        fetched_at = self._tag_members_ts.get(tag_id)
+        if fetched_at is None or time.monotonic() - fetched_at >= self.TAG_MEMBERS_TTL:
+            self._tag_members[tag_id] = {asset['id'] for asset in self._iter_assets_by_tag(tag_id)}
+            self._tag_members_ts[tag_id] = time.monotonic()
+        return self._tag_members[tag_id]
+
+    def tag_assets_bulk(self, pairs: list, skip_existing: bool = True, max_workers: int = 4) -> Dict[str, bool]:
+        """
+        Apply tags to assets, issuing one add_tags_to_assets call per tag in parallel.
+
+        Args:
+            pairs: Iterable of (asset_id, tag_id) tuples
+            skip_existing: Passed through to add_tags_to_assets
+            max_workers: Number of tags processed concurrently
+
+        Returns:
+            Dictionary mapping each tag ID to whether tagging succeeded
+        """
+        assets_by_tag: Dict[str, list] = {}
+        for asset_id, tag_id in pairs:
+            assets_by_tag.setdefault(tag_id, []).append(asset_id)
+        if not assets_by_tag:
+            return {}
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.add_tags_to_assets, asset_ids, tag_id, skip_existing): tag_id
+                for tag_id, asset_ids in assets_by_tag.items()
+            }
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Tagging"):
+                results[futures[future]] = future.result()
+        return results
+
     def get_assets_by_tag(self, tag_id: str) -> list:
         """
         Get all assets with the specified tag.
         Uses search/metadata endpoint since there's no direct tag assets endpoint.
         """
+        return list(self._iter_assets_by_tag(tag_id))
+
+    def _iter_assets_by_tag(self, tag_id: str):
+        """Yield assets carrying the tag page by page, without building the full list."""
         try:
-            # Use search/metadata endpoint with tag filter
-            # Use search/metadata endpoint with tag filter and pagination
-            all_assets = []
-            page = 1
-            
-            while True:
-                response = requests.post(
-                    f"{self.url}/api/search/metadata",
-                    json={
-                        "tagIds": [tag_id],
-                        "page": page,
-                        "size": self.PAGE_SIZE
-                    },
-                    headers=self.headers
-                )
-                
-                if response.status_code == 200:
-                    results = response.json()
-                    assets = results.get('assets', {}).get('items', [])
-                    
-                    if not assets:
-                        break
-                        
-                    all_assets.extend(assets)
-                    
-                    if len(assets) < self.PAGE_SIZE:
-                        break
-                        
-                    page += 1
-                else:
-                    print(f"Failed to get assets for tag {tag_id} (page {page}): {response.text}")
-                    break
-                    
-            return all_assets
-        except Exception as e:
-            print(f"Error getting assets for tag {tag_id}: {e}")
-            return []
+            for assets in self._iter_pages(lambda page: self._fetch_tag_page_items(tag_id, page)):
+                yield from assets
+        except requests.RequestException as e:
+            logger.warning("Error getting assets for tag %s: %s", tag_id, e)
+
+    def _fetch_tag_page_items(self, tag_id: str, page: int) -> Optional[list]:
+        """Fetch one page of assets carrying the given tag, returning None on failure."""
+        response = self._session.post(
+            self._u_search_meta,
+            json={
+                "tagIds": [tag_id],
+                "page": page,
+                "size": self.PAGE_SIZE,
+                "withExif": False
+            }
+        )
+
+        if response.status_code != 200:
+            logger.warning("Failed to get assets for tag %s (page %d): %s", tag_id, page, response.text)
+            return None
+        return response.json().get('assets', {}).get('items', [])
 
     def delete_asset(self, asset_id: str) -> bool:
         """
@@ -392,13 +677,10 @@ class ImmichClient:
         Permanently delete all items in the trash.
         """
         try:
-            response = requests.post(
-                f"{self.url}/api/trash/empty",
-                headers=self.headers
-            )
+            response = self._session.post(self._u_trash_empty)
             return response.status_code in (200, 201, 204)
-        except Exception as e:
-            print(f"Error emptying trash: {e}")
+        except requests.RequestException as e:
+            logger.warning("Error emptying trash: %s", e)
             return False
 
     def get_duplicate_assets(self) -> list:
@@ -406,17 +688,14 @@ class ImmichClient:
         Get all duplicate asset groups from Immich.
         """
         try:
-            response = requests.get(
-                f"{self.url}/api/duplicates",
-                headers=self.headers
-            )
+            response = self._session.get(self._u_duplicates)
             if response.status_code == 200:
                 return response.json()
             else:
-                print(f"Failed to get duplicates: {response.text}")
+                logger.warning("Failed to get duplicates: %s", response.text)
                 return []
-        except Exception as e:
-            print(f"Error getting duplicates: {e}")
+        except requests.RequestException as e:
+            logger.warning("Error getting duplicates: %s", e)
             return []
 
     def delete_assets(self, asset_ids: list) -> bool:
@@ -429,12 +708,14 @@ class ImmichClient:
         try:
             # POST /api/assets (DELETE method with body containing IDs)
             # Actually Immich uses DELETE /api/assets with a body
-            response = requests.delete(
-                f"{self.url}/api/assets",
-                json={"ids": asset_ids},
-                headers=self.headers
-            )
-            return response.status_code in (200, 204)
-        except Exception as e:
-            print(f"Error deleting assets: {e}")
+            def delete_chunk(chunk):
+                response = self._session.delete(
+                    self._u_assets,
+                    json={"ids": chunk}
+                )
+                return response.status_code in (200, 204)
+
+            return self._send_in_chunks(delete_chunk, asset_ids)
+        except requests.RequestException as e:
+            logger.warning("Error deleting assets: %s", e)
             return False
@@ -1,22 +1,34 @@
 import cv2
-from PIL import Image
-from typing import Dict, Optional, Tuple
+import math
+import queue
+import threading
+from contextlib import closing
+from typing import Dict, List, Optional, Tuple
 from .database import DatabaseManager
 from tqdm import tqdm
 from .classifier import WatercolorClassifier
 
 
 class VideoProcessor:
+    # z-score for the two-sided 95% Wilson interval used by early stopping
+    EARLY_STOP_Z = 1.96
+
     def __init__(self, classifier: WatercolorClassifier, db_path: str = None, use_cache: bool = True):
         self.classifier = classifier
         self.use_cache = use_cache
         self.db = DatabaseManager(db_path) if db_path and use_cache else None
+        # The processor squashes every image to this size anyway; shrinking frames
+        # first keeps the per-frame copies at model resolution instead of 1080p/4K
+        size = classifier.processor.image_processor.size
+        self._target_size = (size["width"], size["height"])
 
     def process_video(self, video_path: str, sample_interval_sec: float = 1.0, min_frames: int = 3,
                      detection_threshold: float = 0.3, strict_mode: bool = False,
-                     image_threshold: float = 0.85) -> Dict[str, any]:
+                     image_threshold: float = 0.85, batch_size: int = 16) -> Dict[str, any]:
         """
         Process a video file, sampling frames and classifying them.
+
+        Sampled frames are classified batch_size at a time in a single model call.
         """
         cap = cv2.VideoCapture(video_path)
         if not cap.isOpened():
@@ -34,10 +46,11 @@ class VideoProcessor:
         early_stop_threshold_frames = 0
         if planned_frames_count > 100:
             early_stop_threshold_frames = int(planned_frames_count * 0.1)
-            print(f"Optimization enabled: Will check for early stopping after {early_stop_threshold_frames} frames")
+            print(f"Optimization enabled: Will check for early stopping from {early_stop_threshold_frames} frames on")
 
         results = []
         watercolor_probs = []
+        watercolor_frames_count = 0
 
         print(f"Processing video: {video_path}")
         print(f"Duration: {duration:.2f}s, FPS: {fps}, Total Frames: {total_frames}")
@@ -46,32 +59,26 @@ class VideoProcessor:
 
         pbar = tqdm(total=planned_frames_count)
 
-        current_frame = 0
-        processed_count = 0
-
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            if current_frame % frame_interval == 0:
-                result_data = self._process_frame(
-                    frame, current_frame, fps, strict_mode, image_threshold
-                )
-
-                results.append(result_data)
-                watercolor_probs.append(result_data["probs"].get("a watercolor painting", 0.0))
-                processed_count += 1
-                pbar.update(1)
-
-                # Early stopping check
-                if self._check_early_stopping(
-                    early_stop_threshold_frames, processed_count, results, detection_threshold
-                ):
+        # Decode and downscale on a background thread while the model classifies
+        sampled = ((index, self._prepare_frame(frame)) for index, frame in self._iter_sampled_frames(cap, frame_interval))
+        stopped = False
+        with closing(self._prefetch(self._iter_batches(sampled, batch_size))) as batches:
+            for batch in batches:
+                for result_data in self._process_frames(batch, fps, strict_mode, image_threshold):
+                    results.append(result_data)
+                    watercolor_probs.append(result_data["probs"].get("a watercolor painting", 0.0))
+                    watercolor_frames_count += result_data["is_watercolor"]
+                    pbar.update(1)
+
+                    # Early stopping check
+                    if self._check_early_stopping(
+                        early_stop_threshold_frames, len(results), watercolor_frames_count, detection_threshold
+                    ):
+                        stopped = True
+                        break
+                if stopped:
                     break
 
-            current_frame += 1
-
         cap.release()
         pbar.close()
 
@@ -100,19 +107,99 @@ class VideoProcessor:
 
         return frame_interval, planned_frames_count
 
-    def _process_frame(self, frame, current_frame, fps, strict_mode, image_threshold):
-        """Process a single video frame."""
-        # OpenCV is BGR, PIL needs RGB
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        pil_image = Image.fromarray(frame_rgb)
+    @staticmethod
+    def _iter_sampled_frames(cap, frame_interval):
+        """Yield (frame_index, frame) for every frame_interval-th decoded frame."""
+        current_frame = 0
+        # grab() advances without converting/copying the picture; only sampled
+        # frames pay for retrieve()
+        while cap.grab():
+            if current_frame % frame_interval == 0:
+                ret, frame = cap.retrieve()
+                if not ret:
+                    break
+                yield current_frame, frame
 
-        probs = self.classifier.predict(pil_image)
-        wc_prob = probs.get("a watercolor painting", 0.0)
+            current_frame += 1
 
+    @staticmethod
+    def _iter_batches(frames, batch_size):
+        """Group an iterable of sampled frames into lists of at most batch_size."""
+        batch = []
+        for item in frames:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _prefetch(iterable, depth: int = 2):
+        """
+        Advance an iterator on a background thread, at most depth items ahead.
+
+        OpenCV and torch both release the GIL, so decoding the next batch overlaps
+        with classifying the current one. Closing the generator stops the thread.
+        """
+        items = queue.Queue(maxsize=depth)
+        stop = threading.Event()
+        done = object()
+        errors = []
+
+        def produce():
+            try:
+                for item in iterable:
+                    if stop.is_set():
+                        break
+                    items.put(item)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                items.put(done)
+
+        worker = threading.Thread(target=produce, daemon=True)
+        worker.start()
+        finished = False
+        try:
+            while True:
+                item = items.get()
+                if item is done:
+                    finished = True
+                    break
+                yield item
+            if errors:
+                raise errors[0]
+        finally:
+            # Unblock a producer waiting on a full queue, then wait for it to exit
+            stop.set()
+            while not finished:
+                finished = items.get() is done
+            worker.join()
+
+    def _prepare_frame(self, frame):
+        """Downscale a BGR frame to model resolution and convert it to contiguous RGB."""
+        # Downscale before anything else touches the pixels, so the colour conversion
+        # only runs on the small frame
+        resized = cv2.resize(frame, self._target_size, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
+
+    def _process_frames(self, frames: List[Tuple[int, any]], fps, strict_mode, image_threshold) -> List[Dict]:
+        """Classify a batch of (frame_index, rgb_frame) pairs with one model call."""
+        probs_batch = self.classifier.predict_batch([frame for _, frame in frames])
+
+        return [
+            self._frame_result(current_frame, fps, probs, strict_mode, image_threshold)
+            for (current_frame, _), probs in zip(frames, probs_batch)
+        ]
+
+    def _frame_result(self, current_frame, fps, probs, strict_mode, image_threshold):
+        """Build the per-frame result from its label probabilities."""
+        # Decide on the probabilities we already have instead of running the model again
         if strict_mode:
-            is_wc = self.classifier.is_watercolor_strict(pil_image, threshold=image_threshold)
+            is_wc = WatercolorClassifier.decide_watercolor_strict(probs, threshold=image_threshold)
         else:
-            is_wc = wc_prob > 0.5 and max(probs, key=probs.get) == "a watercolor painting"
+            is_wc = WatercolorClassifier.decide_watercolor(probs, threshold=0.5)
 
         return {
             "frame_index": current_frame,
@@ -122,17 +209,37 @@ class VideoProcessor:
             "top_label": max(probs, key=probs.get)
         }
 
-    def _check_early_stopping(self, threshold_frames, processed_count, results, detection_threshold):
-        """Check if early stopping condition is met."""
-        if threshold_frames > 0 and processed_count == threshold_frames:
-            current_wc_count = sum(1 for r in results if r["is_watercolor"])
-            current_percent = current_wc_count / processed_count
+    def _check_early_stopping(self, threshold_frames, processed_count, watercolor_count, detection_threshold):
+        """
+        Check if early stopping condition is met.
 
-            if current_percent >= detection_threshold:
-                print(f"\nEarly stopping triggered: {current_percent:.2%} watercolor frames detected after {processed_count} frames.")
-                return True
+        From threshold_frames on, stop as soon as the 95% Wilson interval for the
+        watercolor-frame proportion lies entirely above or below detection_threshold.
+        """
+        if threshold_frames == 0 or processed_count < threshold_frames:
+            return False
+
+        lower, upper = self._wilson_bounds(watercolor_count, processed_count, self.EARLY_STOP_Z)
+        current_percent = watercolor_count / processed_count
+
+        if lower >= detection_threshold:
+            print(f"\nEarly stopping triggered: {current_percent:.2%} watercolor frames detected after {processed_count} frames.")
+            return True
+        if upper < detection_threshold:
+            print(f"\nEarly stopping triggered: only {current_percent:.2%} watercolor frames after {processed_count} frames.")
+            return True
         return False
 
+    @staticmethod
+    def _wilson_bounds(successes: int, trials: int, z: float) -> Tuple[float, float]:
+        """Wilson score interval for a binomial proportion."""
+        p = successes / trials
+        z2 = z * z
+        denom = 1 + z2 / trials
+        centre = (p + z2 / (2 * trials)) / denom
+        margin = z * math.sqrt(p * (1 - p) / trials + z2 / (4 * trials * trials)) / denom
+        return centre - margin, centre + margin
+
     def _aggregate_results(self, results, watercolor_probs, planned_frames, total_frames, duration, detection_threshold):
         """Aggregate frame results into final video result."""
         if not results:
@@ -92,6 +92,19 @@ class TestCalculateFileHash:
         finally:
             os.unlink(temp_path)
 
+    def test_calculate_hash_large_file(self, asset_mover):
+        """Test that files spanning several read buffers hash like a one-shot digest"""
+        import hashlib
+        content = os.urandom(1 << 20) + b"tail"
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(content)
+            temp_path = f.name
+
+        try:
+            assert asset_mover.calculate_file_hash(temp_path) == hashlib.sha256(content).hexdigest()
+        finally:
+            os.unlink(temp_path)
+
 
 class TestCalculateDestinationPath:
     """Test destination path calculation"""
@@ -179,16 +192,56 @@ class TestMoveFile:
                 f.write("source content")
             with open(dest_path, 'w') as f:
                 f.write("different content")
-            
+
             result, error, actual_path = asset_mover.move_file(source_path, dest_path)
-            
+
             assert result is True
             assert error is None
             assert actual_path != dest_path
             assert "dest-1.txt" in actual_path
             assert os.path.exists(actual_path)
             assert not os.path.exists(source_path)  # Source should be moved
-    
+
+    def test_move_file_destination_exists_different_size_skips_hash(self, asset_mover, monkeypatch):
+        """Test that files of different sizes are never hashed"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_path = os.path.join(temp_dir, "source.txt")
+            dest_path = os.path.join(temp_dir, "dest.txt")
+
+            with open(source_path, 'w') as f:
+                f.write("short")
+            with open(dest_path, 'w') as f:
+                f.write("a good deal longer")
+
+            hash_mock = Mock(return_value="hash")
+            monkeypatch.setattr(asset_mover, 'calculate_file_hash', hash_mock)
+
+            result, error, actual_path = asset_mover.move_file(source_path, dest_path)
+
+            assert result is True
+            assert actual_path != dest_path
+            hash_mock.assert_not_called()
+
+    def test_move_file_destination_exists_different_prefix_skips_hash(self, asset_mover, monkeypatch):
+        """Test that same-size files differing in their first bytes are never hashed"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_path = os.path.join(temp_dir, "source.txt")
+            dest_path = os.path.join(temp_dir, "dest.txt")
+
+            with open(source_path, 'w') as f:
+                f.write("source")
+            with open(dest_path, 'w') as f:
+                f.write("target")
+
+            hash_mock = Mock(return_value="hash")
+            monkeypatch.setattr(asset_mover, 'calculate_file_hash', hash_mock)
+
+            result, error, actual_path = asset_mover.move_file(source_path, dest_path)
+
+            assert result is True
+            assert actual_path != dest_path
+            hash_mock.assert_not_called()
+
     def test_move_file_dry_run(self, asset_mover_dry_run):
         """Test file move in dry-run mode"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -268,6 +321,41 @@ class TestSaveCSVReport:
         finally:
             os.unlink(temp_path)
 
+    def test_save_csv_report_columns_match_header(self, asset_mover):
+        """Test that row values land under the matching header column"""
+        import csv
+        asset_mover.transaction_log = [
+            {
+                'asset_id': 'test-1',
+                'immich_path': '/path1',
+                'source_path': 'source1',
+                'dest_path': 'dest1',
+                'move_success': True,
+                'delete_success': False,
+                'error': 'boom'
+            }
+        ]
+
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+            temp_path = f.name
+
+        try:
+            asset_mover.save_csv_report(temp_path)
+            with open(temp_path, newline='', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+
+            assert rows == [{
+                'asset_id': 'test-1',
+                'immich_path': '/path1',
+                'source_path': 'source1',
+                'dest_path': 'dest1',
+                'move_success': 'True',
+                'delete_success': 'False',
+                'error': 'boom'
+            }]
+        finally:
+            os.unlink(temp_path)
+
 
 class TestProcessTaggedAssets:
     """Test processing of tagged assets"""
@@ -30,7 +30,7 @@ class TestCrossPlatformPaths:
         assert expected_key in client.path_mappings
         assert client.path_mappings[expected_key] == "/remote/path"
 
-    @patch('src.immich_client.requests.post')
+    @patch('src.immich_client.requests.Session.post')
     def test_get_asset_id_normalizes_input(self, mock_post):
         """Test that get_asset_id_from_path normalizes input path"""
         # Setup client with a standard normalized path
@@ -57,14 +57,11 @@ class TestCrossPlatformPaths:
         # Call the method
         client.get_asset_id_from_path(input_path)
 
-        # Verify the call to requests.post used the correct translated path
-        # It should try "/library/file.jpg" first
+        # Verify the single call to requests.post used the correct translated path
         expected_translated_path = "/library/file.jpg"
         
-        # We check the first call in the list, as the robustness logic might
-        # make subsequent fallback calls if the first one returns no items.
-        first_call_json = mock_post.call_args_list[0].kwargs['json']
-        assert first_call_json['originalPath'] == expected_translated_path
+        mock_post.assert_called_once()
+        assert mock_post.call_args.kwargs['json']['originalPath'] == expected_translated_path
 
     def test_reverse_mapping_handles_mixed_input(self):
         """Test reverse mapping handles Immich paths correctly"""
@@ -152,6 +152,40 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertIsNotNone(cached_result)
         self.assertEqual(cached_result["top_label"], "a watercolor painting")
 
+    def test_save_results_batch(self):
+        """Test saving several results in one transaction."""
+        self.db.save_results([
+            (self.file1, {"is_watercolor": True, "confidence": 0.9, "file_type": "image"}),
+            (self.file2, {"is_watercolor": False, "confidence": 0.1, "file_type": "image"}),
+        ])
+
+        stats = self.db.get_statistics()
+        self.assertEqual(stats["total_files"], 2)
+        self.assertEqual(stats["watercolor_count"], 1)
+
+        # Re-saving updates in place rather than duplicating rows
+        self.db.save_results([(self.file1, {"is_watercolor": False, "file_type": "image"})])
+        self.assertEqual(self.db.get_statistics()["total_files"], 2)
+
+    def test_update_immich_info_many(self):
+        """Test bulk Immich info updates."""
+        self.db.save_result(self.file1, {"is_watercolor": True, "file_type": "image"})
+        self.db.save_result(self.file2, {"is_watercolor": True, "file_type": "image"})
+
+        self.db.update_immich_info_many([
+            (self.file1, "tag-1", "asset-1"),
+            (self.file2, "tag-1", "asset-2"),
+        ])
+
+        self.assertEqual(self.db.get_statistics()["immich_tagged_count"], 2)
+        _, cached = self.db.check_if_processed(self.file2)
+        self.assertEqual(cached["immich_asset_id"], "asset-2")
+
+    def test_uses_wal_journal(self):
+        """Test that the connection is opened in WAL mode."""
+        mode = self.db.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode.lower(), "wal")
+
 
 if __name__ == '__main__':
     unittest.main()
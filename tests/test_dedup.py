@@ -50,6 +50,17 @@ class TestDedupProcessor(unittest.TestCase):
         # 'int2' wins. 'int1' deleted.
         self.assertEqual(to_del_count, 1)
 
+    def test_analyze_group_returns_losers(self):
+        # Higher tier beats size; size breaks ties within a tier
+        group = [
+            {'id': 'ext1', 'originalPath': '/external/a.jpg', 'exifInfo': {'fileSizeInByte': 9000}},
+            {'id': 'int1', 'originalPath': '/upload/a.jpg', 'exifInfo': {'fileSizeInByte': 1000}},
+            {'id': 'int2', 'originalPath': '/upload/b.jpg', 'exifInfo': {'fileSizeInByte': 2000}},
+            {'id': 'int3', 'originalPath': '/upload/c.jpg'},
+        ]
+        losers = self.processor._analyze_group(group)
+        self.assertEqual([a['id'] for a in losers], ['ext1', 'int1', 'int3'])
+
     def test_no_duplicates(self):
         self.mock_client.get_duplicate_assets.return_value = []
         to_del_count = self.processor.execute(dry_run=True)
@@ -3,6 +3,7 @@ Tests for ImmichClient class
 """
 import pytest
 import os
+import requests
 from unittest.mock import Mock, patch
 from src.immich_client import ImmichClient
 
@@ -13,6 +14,8 @@ if os.name == 'nt':
 else:
     LOCAL_PREFIX = "/tmp/library/admin"
 
+LOCAL_PHOTO_PATH = os.path.join(LOCAL_PREFIX, "photo.jpg")
+
 
 @pytest.fixture
 def immich_client():
@@ -49,6 +52,24 @@ class TestImmichClientInit:
         client = ImmichClient("http://test/", "key")
         assert client.url == "http://test"
 
+    def test_session_carries_auth_headers(self):
+        """Test that the pooled session sends the API key on every request"""
+        with ImmichClient("http://test", "key") as client:
+            assert client._session.headers['x-api-key'] == "key"
+
+    def test_session_negotiates_compression(self):
+        """Test that responses are requested compressed (requests decodes them transparently)"""
+        with ImmichClient("http://test", "key") as client:
+            assert 'gzip' in client._session.headers['Accept-Encoding']
+
+    def test_session_retries_transient_failures(self):
+        """Test that rate limits and server errors are retried for every verb used"""
+        with ImmichClient("http://test", "key") as client:
+            retry = client._session.get_adapter("https://test").max_retries
+            assert retry.total == 5
+            assert {429, 500, 502, 503, 504} <= set(retry.status_forcelist)
+            assert {'GET', 'POST', 'PUT', 'DELETE'} <= set(retry.allowed_methods)
+
 
 class TestReversePathMapping:
     """Test reverse path mapping functionality"""
@@ -79,7 +100,7 @@ class TestReversePathMapping:
 class TestGetAssetIdFromPath:
     """Test get_asset_id_from_path functionality"""
 
-    @patch('src.immich_client.requests.post')
+    @patch('src.immich_client.requests.Session.post')
     def test_get_asset_id_success(self, mock_post, immich_client):
         """Test successful asset ID retrieval"""
         mock_response = Mock()
@@ -93,11 +114,27 @@ class TestGetAssetIdFromPath:
         }
         mock_post.return_value = mock_response
 
-        local_path = os.path.join(LOCAL_PREFIX, "photo.jpg")
-        result = immich_client.get_asset_id_from_path(local_path)
+        result = immich_client.get_asset_id_from_path(LOCAL_PHOTO_PATH)
         assert result == 'asset-123'
+        mock_post.assert_called_once_with(
+            f"{immich_client.url}/api/search/metadata",
+            json={"originalPath": '/data/library/admin/photo.jpg', "size": 1, "withExif": False}
+        )
 
-    @patch('src.immich_client.requests.post')
+    @patch('src.immich_client.requests.Session.post')
+    def test_get_asset_id_searches_canonical_path(self, mock_post, immich_client):
+        """Test that an unrooted translated path is searched and compared with a leading slash"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'assets': {'items': [{'id': 'asset-123', 'originalPath': '/relative/photo.jpg'}]}
+        }
+        mock_post.return_value = mock_response
+
+        assert immich_client.get_asset_id_from_path('relative/photo.jpg') == 'asset-123'
+        assert mock_post.call_args.kwargs['json']['originalPath'] == '/relative/photo.jpg'
+
+    @patch('src.immich_client.requests.Session.post')
     def test_get_asset_id_no_results(self, mock_post, immich_client):
         """Test when no assets are found"""
         mock_response = Mock()
@@ -105,24 +142,56 @@ class TestGetAssetIdFromPath:
         mock_response.json.return_value = {'assets': {'items': []}}
         mock_post.return_value = mock_response
 
-        local_path = os.path.join(LOCAL_PREFIX, "photo.jpg")
-        result = immich_client.get_asset_id_from_path(local_path)
+        result = immich_client.get_asset_id_from_path(LOCAL_PHOTO_PATH)
         assert result is None
 
-    @patch('src.immich_client.requests.post')
+    @patch('src.immich_client.requests.Session.post')
     def test_get_asset_id_request_error(self, mock_post, immich_client):
         """Test handling of request errors"""
-        mock_post.side_effect = Exception("Network error")
+        mock_post.side_effect = requests.ConnectionError("Network error")
 
-        local_path = os.path.join(LOCAL_PREFIX, "photo.jpg")
-        result = immich_client.get_asset_id_from_path(local_path)
+        result = immich_client.get_asset_id_from_path(LOCAL_PHOTO_PATH)
         assert result is None
 
 
+class TestBulkHelpers:
+    """Test concurrent bulk lookup and tagging helpers"""
+
+    def test_get_asset_ids_bulk(self, immich_client):
+        """Test that each unique path is resolved once"""
+        with patch.object(immich_client, '_search_asset_by_metadata', side_effect=lambda p: f"id:{p}") as mock_lookup:
+            result = immich_client.get_asset_ids_bulk(['/a.jpg', '/b.jpg', '/a.jpg'])
+
+        assert result == {'/a.jpg': 'id:/a.jpg', '/b.jpg': 'id:/b.jpg'}
+        assert mock_lookup.call_count == 2
+
+    def test_get_asset_ids_bulk_searches_only_cache_misses(self, immich_client):
+        """Test that prefetched paths are resolved without a metadata search"""
+        immich_client._asset_path_map = {'/data/library/admin/hit.jpg': 'asset-hit'}
+        hit = os.path.join(LOCAL_PREFIX, "hit.jpg")
+        miss = os.path.join(LOCAL_PREFIX, "miss.jpg")
+
+        with patch.object(immich_client, '_search_asset_by_metadata', return_value=None) as mock_search:
+            result = immich_client.get_asset_ids_bulk([hit, miss])
+
+        assert result == {hit: 'asset-hit', miss: None}
+        mock_search.assert_called_once_with(miss)
+
+    def test_tag_assets_bulk_groups_by_tag(self, immich_client):
+        """Test that pairs are grouped into one add_tags_to_assets call per tag"""
+        pairs = [('asset-1', 'tag-a'), ('asset-2', 'tag-b'), ('asset-3', 'tag-a')]
+        with patch.object(immich_client, 'add_tags_to_assets', return_value=True) as mock_add:
+            result = immich_client.tag_assets_bulk(pairs)
+
+        assert result == {'tag-a': True, 'tag-b': True}
+        mock_add.assert_any_call(['asset-1', 'asset-3'], 'tag-a', True)
+        mock_add.assert_any_call(['asset-2'], 'tag-b', True)
+
+
 class TestCreateTagIfNotExists:
     """Test create_tag_if_not_exists functionality"""
 
-    @patch('src.immich_client.requests.get')
+    @patch('src.immich_client.requests.Session.get')
     def test_tag_already_exists(self, mock_get, immich_client):
         """Test when tag already exists"""
         mock_response = Mock()
@@ -138,12 +207,11 @@ class TestCreateTagIfNotExists:
         # Verify pagination params were used
         mock_get.assert_called_with(
             f"{immich_client.url}/api/tags",
-            headers=immich_client.headers,
             params={"page": 1, "size": ImmichClient.PAGE_SIZE}
         )
 
-    @patch('src.immich_client.requests.post')
-    @patch('src.immich_client.requests.get')
+    @patch('src.immich_client.requests.Session.post')
+    @patch('src.immich_client.requests.Session.get')
     def test_create_new_tag(self, mock_get, mock_post, immich_client):
         """Test creating a new tag"""
         mock_get_response = Mock()
@@ -159,10 +227,127 @@ class TestCreateTagIfNotExists:
         result = immich_client.create_tag_if_not_exists('NewTag')
         assert result == 'new-tag-123'
 
-    @patch('src.immich_client.requests.get')
+    @patch('src.immich_client.requests.Session.post')
+    @patch('src.immich_client.requests.Session.get')
+    def test_tag_list_fetched_once(self, mock_get, mock_post, immich_client):
+        """Test that repeated lookups and new tags are served from the tag cache"""
+        mock_get_response = Mock()
+        mock_get_response.status_code = 200
+        mock_get_response.json.return_value = [{'id': 'tag-123', 'name': 'Watercolor'}]
+        mock_get.return_value = mock_get_response
+
+        mock_post_response = Mock()
+        mock_post_response.status_code = 201
+        mock_post_response.json.return_value = {'id': 'new-tag-123'}
+        mock_post.return_value = mock_post_response
+
+        assert immich_client.create_tag_if_not_exists('Watercolor') == 'tag-123'
+        assert immich_client.create_tag_if_not_exists('NewTag') == 'new-tag-123'
+        assert immich_client.create_tag_if_not_exists('NewTag') == 'new-tag-123'
+        assert immich_client.create_tag_if_not_exists('Watercolor') == 'tag-123'
+
+        assert mock_get.call_count == 1
+        assert mock_post.call_count == 1
+
+    @patch('src.immich_client.requests.Session.post')
+    @patch('src.immich_client.requests.Session.get')
+    def test_create_tag_conflict_refreshes_cache(self, mock_get, mock_post, immich_client):
+        """Test that a 409 on create reloads the tag list instead of recursing"""
+        empty_response = Mock()
+        empty_response.status_code = 200
+        empty_response.json.return_value = []
+        listed_response = Mock()
+        listed_response.status_code = 200
+        listed_response.json.return_value = [{'id': 'tag-race', 'name': 'Race'}]
+        mock_get.side_effect = [empty_response, listed_response]
+
+        conflict_response = Mock()
+        conflict_response.status_code = 409
+        mock_post.return_value = conflict_response
+
+        assert immich_client.create_tag_if_not_exists('Race') == 'tag-race'
+        assert mock_post.call_count == 1
+
+    @patch('src.immich_client.requests.Session.post')
+    @patch('src.immich_client.requests.Session.get')
+    def test_create_tag_conflict_reload_is_unconditional(self, mock_get, mock_post, immich_client):
+        """Test that the 409 reload never sends If-None-Match, so a 304 can't keep the stale map"""
+        empty_response = Mock()
+        empty_response.status_code = 200
+        empty_response.headers = {'ETag': '"v1"'}
+        empty_response.json.return_value = []
+        listed_response = Mock()
+        listed_response.status_code = 200
+        listed_response.headers = {'ETag': '"v2"'}
+        listed_response.json.return_value = [{'id': 'tag-race', 'name': 'Race'}]
+        not_modified_response = Mock()
+        not_modified_response.status_code = 304
+
+        def get(url, params=None, headers=None):
+            if mock_get.call_count == 1:
+                return empty_response
+            return not_modified_response if headers else listed_response
+        mock_get.side_effect = get
+
+        conflict_response = Mock()
+        conflict_response.status_code = 409
+        mock_post.return_value = conflict_response
+
+        assert immich_client.create_tag_if_not_exists('Race') == 'tag-race'
+        assert mock_get.call_args.kwargs.get('headers') is None
+
+    @patch('src.immich_client.requests.Session.get')
+    def test_invalidate_tag_cache_forces_reload(self, mock_get, immich_client):
+        """Test that invalidate_tag_cache makes the next lookup list tags again"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.json.return_value = [{'id': 'tag-123', 'name': 'Watercolor'}]
+        mock_get.return_value = mock_response
+
+        assert immich_client.create_tag_if_not_exists('Watercolor') == 'tag-123'
+        immich_client.invalidate_tag_cache()
+        assert immich_client.create_tag_if_not_exists('Watercolor') == 'tag-123'
+
+        assert mock_get.call_count == 2
+
+    @patch('src.immich_client.requests.Session.get')
+    def test_invalidate_tag_cache_revalidates_with_etag(self, mock_get, immich_client):
+        """Test that the reload after invalidate_tag_cache is conditional and keeps the map on 304"""
+        listed_response = Mock()
+        listed_response.status_code = 200
+        listed_response.headers = {'ETag': '"v1"'}
+        listed_response.json.return_value = [{'id': 'tag-123', 'name': 'Watercolor'}]
+        not_modified_response = Mock()
+        not_modified_response.status_code = 304
+        mock_get.side_effect = [listed_response, not_modified_response]
+
+        assert immich_client.create_tag_if_not_exists('Watercolor') == 'tag-123'
+        immich_client.invalidate_tag_cache()
+        assert immich_client.create_tag_if_not_exists('Watercolor') == 'tag-123'
+
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+
+    @patch('src.immich_client.requests.Session.get')
+    def test_tag_reload_revalidates_with_etag(self, mock_get, immich_client):
+        """Test that reloading the tag list sends If-None-Match and keeps the map on 304"""
+        listed_response = Mock()
+        listed_response.status_code = 200
+        listed_response.headers = {'ETag': '"v1"'}
+        listed_response.json.return_value = [{'id': 'tag-123', 'name': 'Watercolor'}]
+        not_modified_response = Mock()
+        not_modified_response.status_code = 304
+        mock_get.side_effect = [listed_response, not_modified_response]
+
+        assert immich_client.create_tag_if_not_exists('Watercolor') == 'tag-123'
+        assert immich_client._load_tag_cache() == {'Watercolor': 'tag-123'}
+        assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+
+    @patch('src.immich_client.requests.Session.get')
     def test_create_tag_error(self, mock_get, immich_client):
         """Test error handling in tag creation"""
-        mock_get.side_effect = Exception("API error")
+        mock_get.side_effect = requests.ConnectionError("API error")
 
         result = immich_client.create_tag_if_not_exists('Tag')
         assert result is None
@@ -171,7 +356,7 @@ class TestCreateTagIfNotExists:
 class TestAddTagToAsset:
     """Test add_tag_to_asset functionality"""
 
-    @patch('src.immich_client.requests.put')
+    @patch('src.immich_client.requests.Session.put')
     def test_add_tag_success(self, mock_put, immich_client):
         """Test successful tag addition"""
         mock_response = Mock()
@@ -181,7 +366,7 @@ class TestAddTagToAsset:
         result = immich_client.add_tag_to_asset('asset-123', 'tag-456')
         assert result is True
 
-    @patch('src.immich_client.requests.put')
+    @patch('src.immich_client.requests.Session.put')
     def test_add_tag_failure(self, mock_put, immich_client):
         """Test failed tag addition"""
         mock_response = Mock()
@@ -192,10 +377,30 @@ class TestAddTagToAsset:
         assert result is False
 
 
+class TestAddTagsToAssets:
+    """Test add_tags_to_assets functionality"""
+
+    @patch('src.immich_client.requests.Session.put')
+    def test_membership_fetched_once_per_tag(self, mock_put, immich_client):
+        """Test that consecutive batches reuse the cached tag membership"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_put.return_value = mock_response
+
+        with patch.object(immich_client, '_iter_assets_by_tag', return_value=iter([{'id': 'asset-1'}])) as mock_get:
+            assert immich_client.add_tags_to_assets(['asset-1', 'asset-2'], 'tag-1') is True
+            assert immich_client.add_tags_to_assets(['asset-2', 'asset-3'], 'tag-1') is True
+
+        mock_get.assert_called_once_with('tag-1')
+        # asset-1 was already tagged, asset-2 was tagged by the first batch
+        assert mock_put.call_args_list[0].kwargs['json'] == {"ids": ['asset-2']}
+        assert mock_put.call_args_list[1].kwargs['json'] == {"ids": ['asset-3']}
+
+
 class TestGetAssetsByTag:
     """Test get_assets_by_tag functionality"""
 
-    @patch('src.immich_client.requests.post')
+    @patch('src.immich_client.requests.Session.post')
     def test_get_assets_success(self, mock_post, immich_client):
         """Test successful retrieval of tagged assets"""
         mock_response = Mock()
@@ -217,11 +422,11 @@ class TestGetAssetsByTag:
         # Verify pagination params
         mock_post.assert_called_with(
             f"{immich_client.url}/api/search/metadata",
-            json={"tagIds": ['tag-123'], "page": 1, "size": ImmichClient.PAGE_SIZE},
-            headers=immich_client.headers
+            json={"tagIds": ['tag-123'], "page": 1, "size": ImmichClient.PAGE_SIZE, "withExif": False}
         )
 
-    @patch('src.immich_client.requests.post')
+    @patch.object(ImmichClient, 'PAGE_WINDOW', 1)
+    @patch('src.immich_client.requests.Session.post')
     def test_get_assets_pagination(self, mock_post, immich_client):
         """Test pagination for assets"""
         # Page 1 response (full page, implying more pages might exist)
@@ -248,16 +453,39 @@ class TestGetAssetsByTag:
         # Check calls
         mock_post.assert_any_call(
             f"{immich_client.url}/api/search/metadata",
-            json={"tagIds": ['tag-123'], "page": 1, "size": ImmichClient.PAGE_SIZE},
-            headers=immich_client.headers
+            json={"tagIds": ['tag-123'], "page": 1, "size": ImmichClient.PAGE_SIZE, "withExif": False}
         )
         mock_post.assert_any_call(
             f"{immich_client.url}/api/search/metadata",
-            json={"tagIds": ['tag-123'], "page": 2, "size": ImmichClient.PAGE_SIZE},
-            headers=immich_client.headers
+            json={"tagIds": ['tag-123'], "page": 2, "size": ImmichClient.PAGE_SIZE, "withExif": False}
         )
 
-    @patch('src.immich_client.requests.post')
+    @patch.object(ImmichClient, 'PAGE_WINDOW', 3)
+    @patch('src.immich_client.requests.Session.post')
+    def test_get_assets_window_stops_at_short_page(self, mock_post, immich_client):
+        """Test that a concurrent window ignores pages after the first short page"""
+        page_lengths = {1: ImmichClient.PAGE_SIZE, 2: ImmichClient.PAGE_SIZE, 3: 1, 4: ImmichClient.PAGE_SIZE}
+
+        def page_response(url, json):
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {'assets': {'items': [
+                {'id': f"asset-{json['page']}-{i}"} for i in range(page_lengths.get(json['page'], 0))
+            ]}}
+            return response
+
+        mock_post.side_effect = page_response
+
+        result = immich_client.get_assets_by_tag('tag-123')
+
+        assert len(result) == 2 * ImmichClient.PAGE_SIZE + 1
+        assert result[-1]['id'] == 'asset-3-0'
+        assert not any(asset['id'].startswith('asset-4-') for asset in result)
+        # The next window (starting at page 5) is never requested
+        requested_pages = {c.kwargs['json']['page'] for c in mock_post.call_args_list}
+        assert 5 not in requested_pages
+
+    @patch('src.immich_client.requests.Session.post')
     def test_get_assets_empty(self, mock_post, immich_client):
         """Test when no assets have the tag"""
         mock_response = Mock()
@@ -269,10 +497,105 @@ class TestGetAssetsByTag:
         assert result == []
 
 
+class TestPrefetchAssetPathMap:
+    """Test prefetch_asset_path_map functionality"""
+
+    @patch('src.immich_client.requests.Session.post')
+    def test_prefetch_multiple_pages(self, mock_post, immich_client):
+        """Test that every page is merged into the path map"""
+        def page_response(url, json):
+            start = (json['page'] - 1) * ImmichClient.PAGE_SIZE
+            count = ImmichClient.PAGE_SIZE if json['page'] < 3 else 5
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {'assets': {'items': [
+                {'id': f'asset-{i}', 'originalPath': f'/data/{i}.jpg'} for i in range(start, start + count)
+            ]}}
+            return response
+
+        mock_post.side_effect = page_response
+
+        immich_client.prefetch_asset_path_map()
+
+        assert len(immich_client._asset_path_map) == 2 * ImmichClient.PAGE_SIZE + 5
+        assert immich_client._asset_path_map['/data/0.jpg'] == 'asset-0'
+
+    @patch.object(ImmichClient, 'PAGE_WINDOW', 1)
+    @patch('src.immich_client.requests.Session.get')
+    @patch('src.immich_client.requests.Session.post')
+    def test_prefetch_remembers_fallback_endpoint(self, mock_post, mock_get, immich_client):
+        """Test that the endpoint probe runs once, not on every page"""
+        not_found = Mock()
+        not_found.status_code = 404
+        mock_post.return_value = not_found
+
+        def page_response(url, params):
+            count = ImmichClient.PAGE_SIZE if params['skip'] == 0 else 3
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = [
+                {'id': f'asset-{params["skip"] + i}', 'originalPath': f'/data/{params["skip"] + i}.jpg'}
+                for i in range(count)
+            ]
+            return response
+
+        mock_get.side_effect = page_response
+
+        immich_client.prefetch_asset_path_map()
+
+        assert len(immich_client._asset_path_map) == ImmichClient.PAGE_SIZE + 3
+        assert mock_post.call_count == 1
+        assert mock_get.call_count == 2
+
+    @patch('src.immich_client.requests.Session.post')
+    def test_prefetch_canonicalizes_leading_slash(self, mock_post, immich_client):
+        """Test that paths stored without a leading slash are found in one lookup"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'assets': {'items': [
+            {'id': 'asset-1', 'originalPath': 'data/library/admin/relative.jpg'}
+        ]}}
+        mock_post.return_value = mock_response
+
+        immich_client.prefetch_asset_path_map()
+
+        assert immich_client.get_asset_id_from_path(os.path.join(LOCAL_PREFIX, "relative.jpg")) == 'asset-1'
+        assert list(immich_client._asset_path_map) == ['/data/library/admin/relative.jpg']
+
+    @patch('src.immich_client.requests.Session.post')
+    def test_complete_map_miss_skips_search(self, mock_post, immich_client):
+        """Test that a miss against a fully loaded map makes no metadata search"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'assets': {'items': [
+            {'id': 'asset-1', 'originalPath': '/data/library/admin/known.jpg'}
+        ]}}
+        mock_post.return_value = mock_response
+
+        immich_client.prefetch_asset_path_map()
+        mock_post.reset_mock()
+
+        assert immich_client.get_asset_id_from_path(os.path.join(LOCAL_PREFIX, "unknown.jpg")) is None
+        mock_post.assert_not_called()
+
+    @patch('src.immich_client.requests.Session.post')
+    def test_partial_map_miss_falls_back_to_search(self, mock_post, immich_client):
+        """Test that a failed prefetch page keeps the metadata-search fallback"""
+        mock_response = Mock()
+        mock_response.status_code = 500
+        mock_post.return_value = mock_response
+
+        immich_client.prefetch_asset_path_map()
+        mock_post.reset_mock()
+
+        assert immich_client.get_asset_id_from_path(os.path.join(LOCAL_PREFIX, "unknown.jpg")) is None
+        assert mock_post.called
+
+
 class TestDeleteAsset:
     """Test delete_asset functionality"""
 
-    @patch('src.immich_client.requests.delete')
+    @patch('src.immich_client.requests.Session.delete')
     def test_delete_asset_success(self, mock_delete, immich_client):
         """Test successful asset deletion"""
         mock_response = Mock()
@@ -282,7 +605,7 @@ class TestDeleteAsset:
         result = immich_client.delete_asset('asset-123')
         assert result is True
 
-    @patch('src.immich_client.requests.delete')
+    @patch('src.immich_client.requests.Session.delete')
     def test_delete_asset_failure(self, mock_delete, immich_client):
         """Test failed asset deletion"""
         mock_response = Mock()
@@ -292,10 +615,37 @@ class TestDeleteAsset:
         result = immich_client.delete_asset('asset-123')
         assert result is False
 
-    @patch('src.immich_client.requests.delete')
+    @patch('src.immich_client.requests.Session.delete')
+    def test_delete_assets_chunked(self, mock_delete, immich_client):
+        """Test that large deletes are split into BATCH_SIZE bodies"""
+        mock_response = Mock()
+        mock_response.status_code = 204
+        mock_delete.return_value = mock_response
+
+        asset_ids = [f'asset-{i}' for i in range(ImmichClient.BATCH_SIZE * 2 + 1)]
+        result = immich_client.delete_assets(asset_ids)
+
+        assert result is True
+        assert mock_delete.call_count == 3
+        sent = sorted(len(c.kwargs['json']['ids']) for c in mock_delete.call_args_list)
+        assert sent == [1, ImmichClient.BATCH_SIZE, ImmichClient.BATCH_SIZE]
+
+    @patch('src.immich_client.requests.Session.delete')
+    def test_delete_assets_chunk_failure(self, mock_delete, immich_client):
+        """Test that one failed chunk fails the whole delete"""
+        ok_response = Mock()
+        ok_response.status_code = 204
+        failed_response = Mock()
+        failed_response.status_code = 500
+        mock_delete.side_effect = lambda url, json: failed_response if 'asset-0' in json['ids'] else ok_response
+
+        asset_ids = [f'asset-{i}' for i in range(ImmichClient.BATCH_SIZE + 1)]
+        assert immich_client.delete_assets(asset_ids) is False
+
+    @patch('src.immich_client.requests.Session.delete')
     def test_delete_asset_exception(self, mock_delete, immich_client):
         """Test exception handling in asset deletion"""
-        mock_delete.side_effect = Exception("Network error")
+        mock_delete.side_effect = requests.ConnectionError("Network error")
 
         result = immich_client.delete_asset('asset-123')
         assert result is False
@@ -75,6 +75,35 @@ class TestPaintingTag(unittest.TestCase):
         calls = [args[0] for args, _ in self.immich_client.create_tag_if_not_exists.call_args_list]
         self.assertNotIn('Painting', calls)
 
+    def test_untaggable_result_skips_immich(self):
+        # A low-confidence photograph earns no tags, so Immich is never queried
+        result_data = {
+            'file_path': 'test_photo.jpg',
+            'confidence': 0.1,
+            'top_label': 'a photograph'
+        }
+
+        self.batch_processor._tag_asset_if_needed(self.immich_client, 'base_tag_id', 'test_photo.jpg', result_data)
+
+        self.assertEqual(self.immich_client.method_calls, [])
+
+    def test_asset_id_resolved_once(self):
+        # Granular and Painting tags share one asset lookup
+        result_data = {
+            'file_path': 'test.jpg',
+            'confidence': 0.9,
+            'top_label': 'a watercolor painting'
+        }
+        self.immich_client.create_tag_if_not_exists.return_value = 'tag_id_123'
+        self.immich_client.get_asset_id_from_path.return_value = 'asset_id_456'
+        self.immich_client.add_tag_to_asset.return_value = True
+
+        tagged = []
+        self.batch_processor._tag_asset_if_needed(self.immich_client, 'base_tag_id', 'test.jpg', result_data, tagged)
+
+        self.immich_client.get_asset_id_from_path.assert_called_once_with('test.jpg')
+        self.assertEqual(tagged, ['test.jpg -> Watercolor85', 'test.jpg -> Painting'])
+
 
 if __name__ == '__main__':
     unittest.main()
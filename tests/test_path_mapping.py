@@ -1,89 +1,54 @@
-import unittest
+import pytest
 from unittest.mock import MagicMock, patch
 from src.immich_client import ImmichClient
 
 
-class TestImmichClientPathMapping(unittest.TestCase):
-    def setUp(self):
-        self.mappings = {
-            "/mnt/photos": "/usr/src/app/photos",
-            "/Volumes/External": "/library"
-        }
-        self.client = ImmichClient("http://localhost:2283", "test-key", self.mappings)
-
-    @patch('requests.post')
-    def test_get_asset_id_with_mapping(self, mock_post):
-        # Mock search response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "assets": {
-                "items": [
-                    {
-                        "id": "asset-mapped",
-                        "originalPath": "/usr/src/app/photos/vacation/img.jpg",
-                        "originalFileName": "img.jpg"
-                    }
-                ]
-            }
-        }
-        mock_post.return_value = mock_response
-
-        # Local path that should be mapped
-        local_path = "/mnt/photos/vacation/img.jpg"
-
-        asset_id = self.client.get_asset_id_from_path(local_path)
-        self.assertEqual(asset_id, "asset-mapped")
-
-    @patch('requests.post')
-    def test_get_asset_id_without_mapping_match(self, mock_post):
-        # Mock search response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "assets": {
-                "items": [
-                    {
-                        "id": "asset-direct",
-                        "originalPath": "/other/path/img.jpg",
-                        "originalFileName": "img.jpg"
-                    }
-                ]
-            }
-        }
-        mock_post.return_value = mock_response
-
-        # Path that doesn't match any mapping prefix
-        local_path = "/other/path/img.jpg"
+@pytest.fixture
+def client():
+    """Create an ImmichClient with two path mappings"""
+    mappings = {
+        "/mnt/photos": "/usr/src/app/photos",
+        "/Volumes/External": "/library"
+    }
+    return ImmichClient("http://localhost:2283", "test-key", mappings)
 
-        asset_id = self.client.get_asset_id_from_path(local_path)
-        self.assertEqual(asset_id, "asset-direct")
 
-    @patch('requests.post')
-    def test_get_asset_id_mapping_mismatch(self, mock_post):
-        # Mock search response where mapped path doesn't match originalPath
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+@pytest.fixture
+def make_response():
+    """Build a search/metadata response holding a single asset"""
+    def _make(asset_id, original_path):
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {
             "assets": {
                 "items": [
                     {
-                        "id": "asset-wrong",
-                        "originalPath": "/usr/src/app/photos/different/img.jpg",
+                        "id": asset_id,
+                        "originalPath": original_path,
                         "originalFileName": "img.jpg"
                     }
                 ]
             }
         }
-        mock_post.return_value = mock_response
-
-        local_path = "/mnt/photos/vacation/img.jpg"
-        # Mapped: /usr/src/app/photos/vacation/img.jpg
-        # Original: /usr/src/app/photos/different/img.jpg
+        return response
+    return _make
 
-        asset_id = self.client.get_asset_id_from_path(local_path)
-        self.assertIsNone(asset_id)
 
-
-if __name__ == '__main__':
-    unittest.main()
+class TestImmichClientPathMapping:
+    @pytest.mark.parametrize("asset_id, original_path, local_path, expected", [
+        # Local path that should be mapped
+        ("asset-mapped", "/usr/src/app/photos/vacation/img.jpg",
+         "/mnt/photos/vacation/img.jpg", "asset-mapped"),
+        # Path that doesn't match any mapping prefix
+        ("asset-direct", "/other/path/img.jpg",
+         "/other/path/img.jpg", "asset-direct"),
+        # Mapped to /usr/src/app/photos/vacation/img.jpg, but the server returned a different originalPath
+        ("asset-wrong", "/usr/src/app/photos/different/img.jpg",
+         "/mnt/photos/vacation/img.jpg", None),
+    ], ids=["with_mapping", "without_mapping_match", "mapping_mismatch"])
+    @patch('requests.Session.post')
+    def test_get_asset_id(self, mock_post, client, make_response,
+                          asset_id, original_path, local_path, expected):
+        mock_post.return_value = make_response(asset_id, original_path)
+
+        assert client.get_asset_id_from_path(local_path) == expected
@@ -1,6 +1,6 @@
 import unittest
 import os
-from src.immich_client import ImmichClient
+from src.immich_client import ImmichClient, _translate_path
 
 
 class TestPathTranslation(unittest.TestCase):
@@ -44,6 +44,20 @@ class TestPathTranslation(unittest.TestCase):
         expected = os.path.normpath("C:\\Photos\\2025\\photo.jpg")
         self.assertEqual(local_path, expected)
 
+    def test_translation_is_memoized(self):
+        mappings = {
+            "C:\\Photos": "/usr/src/app/upload/library/admin"
+        }
+        client = ImmichClient("http://localhost:2283", "api-key", mappings)
+
+        local_path = "C:\\Photos\\2025\\memo.jpg"
+        first = client.translate_path_to_immich(local_path)
+        hits_before = _translate_path.cache_info().hits
+        second = client.translate_path_to_immich(local_path)
+
+        self.assertEqual(first, second)
+        self.assertEqual(_translate_path.cache_info().hits, hits_before + 1)
+
 
 if __name__ == '__main__':
     unittest.main()
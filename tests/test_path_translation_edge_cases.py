@@ -33,23 +33,58 @@ class TestPathTranslationEdgeCases:
         translated = client.translate_path_to_immich(path)
         assert translated == "/library/vacation/img.jpg"
 
+    @pytest.mark.skipif(os.name != 'nt', reason="Windows specific test")
+    def test_multiple_slashes_in_input_windows(self):
+        """Test that multiple backslashes in a Windows input path are collapsed."""
+        client = ImmichClient("http://test", "key", {})
+
+        translated = client.translate_path_to_immich("C:\\\\Photos\\\\\\img.jpg")
+        assert "//" not in translated[1:]  # Allow leading // for UNC if necessary, but generally avoid
+
+    @pytest.mark.skipif(os.name == 'nt', reason="POSIX specific test")
     def test_multiple_slashes_in_input(self):
         """Test that multiple slashes in input path are collapsed."""
         client = ImmichClient("http://test", "key", {})
-        
-        if os.name == 'nt':
-            path = "C:\\\\Photos\\\\\\img.jpg"
-        else:
-            path = "//data///photos//img.jpg"
-            
-        translated = client.translate_path_to_immich(path)
-        assert "//" not in translated[1:] # Allow leading // for UNC if necessary, but generally avoid
 
+        translated = client.translate_path_to_immich("//data///photos//img.jpg")
+        assert "//" not in translated[1:]  # Allow leading // for UNC if necessary, but generally avoid
+
+    def test_nested_mappings_use_longest_prefix(self):
+        """Test that nested mappings resolve to the most specific prefix in both directions."""
+        mappings = {
+            "/photos": "/library",
+            "/photos/archive": "/archive-library"
+        }
+        client = ImmichClient("http://test", "key", mappings)
+
+        assert client.translate_path_to_immich("/photos/archive/img.jpg") == "/archive-library/img.jpg"
+        assert client.translate_path_to_immich("/photos/2025/img.jpg") == "/library/2025/img.jpg"
+        assert client.reverse_path_mapping("/archive-library/img.jpg") == os.path.normpath("/photos/archive/img.jpg")
+
+    def test_many_mappings(self):
+        """Test that lookups stay correct with a large mapping table."""
+        mappings = {f"/photos/lib{i}": f"/library/{i}" for i in range(10000)}
+        mappings["/photos/lib42/archive"] = "/archive-library"
+        client = ImmichClient("http://test", "key", mappings)
+
+        assert client.translate_path_to_immich("/photos/lib9999/a/img.jpg") == "/library/9999/a/img.jpg"
+        assert client.translate_path_to_immich("/photos/lib42/archive/img.jpg") == "/archive-library/img.jpg"
+        assert client.translate_path_to_immich("/photos/lib42/img.jpg") == "/library/42/img.jpg"
+        # lib1000 is a string prefix of lib10000 but not a directory prefix
+        assert client.translate_path_to_immich("/photos/lib10000/img.jpg") == "/photos/lib10000/img.jpg"
+        assert client.reverse_path_mapping("/library/9999/a/img.jpg") == os.path.normpath("/photos/lib9999/a/img.jpg")
+        assert client.reverse_path_mapping("/archive-library/img.jpg") == os.path.normpath("/photos/lib42/archive/img.jpg")
+
+    def test_reverse_prefix_boundary_match(self):
+        """Test that reverse mapping also only matches at directory boundaries."""
+        client = ImmichClient("http://test", "key", {"/photos": "/library/"})
+
+        assert client.reverse_path_mapping("/library/img.jpg") == os.path.normpath("/photos/img.jpg")
+        assert client.reverse_path_mapping("/library-extended/img.jpg") is None
+
+    @pytest.mark.skipif(os.name != 'nt', reason="Windows specific test")
     def test_windows_drive_letter_no_mapping(self):
         """Test how Windows drive letters are handled when no mapping is present."""
-        if os.name != 'nt':
-            pytest.skip("Windows specific test")
-            
         client = ImmichClient("http://test", "key", {})
         path = "C:\\Photos\\img.jpg"
         translated = client.translate_path_to_immich(path)
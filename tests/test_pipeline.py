@@ -1,28 +1,29 @@
 import os
-import sys
+import tempfile
 from PIL import Image
 import unittest
+from unittest.mock import patch
 from src.classifier import WatercolorClassifier
 
-# Add project root to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 
 class TestWatercolorClassifier(unittest.TestCase):
-    def setUp(self):
-        self.classifier = WatercolorClassifier()
-        # Create a dummy image
-        self.test_image_path = "test_image.jpg"
-        img = Image.new('RGB', (224, 224), color='red')
-        img.save(self.test_image_path)
+    @classmethod
+    def setUpClass(cls):
+        # Loading the model dominates this suite, so share one classifier across tests
+        cls.classifier = WatercolorClassifier()
+        # Create a dummy image once; no test modifies it
+        cls._tmp_dir = tempfile.TemporaryDirectory()
+        cls.test_image_path = os.path.join(cls._tmp_dir.name, "test_image.jpg")
+        Image.new('RGB', (224, 224), color='red').save(cls.test_image_path)
 
-    def tearDown(self):
-        if os.path.exists(self.test_image_path):
-            os.remove(self.test_image_path)
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp_dir.cleanup()
 
     def test_predict_structure(self):
         """Test that predict returns a dictionary with expected keys and values."""
-        probs = self.classifier.predict(self.test_image_path)
+        # In-memory image: no JPEG round trip (test_image_features_cached covers file paths)
+        probs = self.classifier.predict(Image.new('RGB', (224, 224), color='red'))
 
         self.assertIsInstance(probs, dict)
         self.assertIn("a watercolor painting", probs)
@@ -32,10 +33,52 @@ class TestWatercolorClassifier(unittest.TestCase):
         total_prob = sum(probs.values())
         self.assertAlmostEqual(total_prob, 1.0, places=4)
 
-    def test_is_watercolor_logic(self):
-        """Test the boolean logic (even if result is not meaningful for a red square)."""
+    @patch.object(WatercolorClassifier, 'predict',
+                  return_value={"a watercolor painting": 0.9, "a photograph": 0.1})
+    def test_is_watercolor_logic(self, mock_predict):
+        """Test the boolean logic on canned probabilities, without a forward pass."""
         is_wc = self.classifier.is_watercolor(self.test_image_path)
         self.assertIsInstance(is_wc, bool)
+        self.assertTrue(is_wc)
+        self.assertFalse(self.classifier.is_watercolor(self.test_image_path, threshold=0.95))
+        mock_predict.assert_called_with(self.test_image_path)
+
+    def test_image_features_cached(self):
+        """Test that the vision encoder runs once per image path."""
+        first = self.classifier.compute_image_features(self.test_image_path)
+        second = self.classifier.compute_image_features(self.test_image_path)
+        self.assertIs(first, second)
+
+        probs = self.classifier.predict_from_features(first)
+        self.assertAlmostEqual(sum(probs.values()), 1.0, places=4)
+
+    def test_predict_batch_matches_predict(self):
+        """Test that batched prediction returns one probability dict per image, in order."""
+        images = [Image.new('RGB', (224, 224), color=c) for c in ('red', 'blue')]
+        batch = self.classifier.predict_batch(images)
+
+        self.assertEqual(len(batch), 2)
+        single = self.classifier.predict(images[1])
+        for label, prob in single.items():
+            self.assertAlmostEqual(batch[1][label], prob, places=4)
+
+    def test_predict_accepts_rgb_array(self):
+        """Test that an RGB ndarray (e.g. a flipped BGR video frame) classifies like the PIL image."""
+        import numpy as np
+        image = Image.new('RGB', (224, 224), color='blue')
+        bgr = np.asarray(image)[:, :, ::-1]
+
+        from_array = self.classifier.predict(bgr[:, :, ::-1])
+        from_image = self.classifier.predict(image)
+        for label, prob in from_image.items():
+            self.assertAlmostEqual(from_array[label], prob, places=4)
+
+    def test_decide_watercolor_strict(self):
+        """Test the strict decision function on precomputed probabilities."""
+        probs = {"a watercolor painting": 0.9, "a photograph": 0.05, "digital art": 0.05}
+        self.assertTrue(WatercolorClassifier.decide_watercolor_strict(probs, threshold=0.85))
+        self.assertFalse(WatercolorClassifier.decide_watercolor_strict(probs, threshold=0.95))
+        self.assertTrue(WatercolorClassifier.decide_watercolor(probs, threshold=0.85))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,41 @@
+"""
+Tests for VideoProcessor early stopping
+"""
+import pytest
+from unittest.mock import MagicMock
+from src.video_processor import VideoProcessor
+
+
+@pytest.fixture
+def video_processor():
+    """Create a VideoProcessor around a mocked classifier"""
+    return VideoProcessor(MagicMock(), use_cache=False)
+
+
+class TestEarlyStopping:
+    """Test the Wilson-interval early stopping rule"""
+
+    def test_no_check_before_threshold(self, video_processor):
+        """Test that nothing stops before the warm-up frame count"""
+        assert video_processor._check_early_stopping(50, 49, 49, 0.3) is False
+
+    def test_disabled_for_short_videos(self, video_processor):
+        """Test that a zero threshold disables early stopping"""
+        assert video_processor._check_early_stopping(0, 500, 500, 0.3) is False
+
+    def test_stops_when_clearly_watercolor(self, video_processor):
+        """Test stopping once the lower bound clears the detection threshold"""
+        assert video_processor._check_early_stopping(50, 50, 40, 0.3) is True
+
+    def test_stops_when_clearly_not_watercolor(self, video_processor):
+        """Test stopping once the upper bound falls below the detection threshold"""
+        assert video_processor._check_early_stopping(50, 50, 2, 0.3) is True
+
+    def test_continues_when_uncertain(self, video_processor):
+        """Test that a proportion near the threshold keeps sampling"""
+        assert video_processor._check_early_stopping(50, 50, 15, 0.3) is False
+
+    def test_wilson_bounds_contain_proportion(self):
+        """Test that the interval brackets the observed proportion"""
+        lower, upper = VideoProcessor._wilson_bounds(15, 50, VideoProcessor.EARLY_STOP_Z)
+        assert 0.0 <= lower < 0.3 < upper <= 1.0